@@ -0,0 +1,147 @@
+"""Benchmark the built-in codecs against the generic Parquet path (and pickle).
+
+Run with `python benchmarks/bench_codecs.py [--rows N] [--repeat R]`.
+Requires `numpy`, `pandas`, `pyarrow` and `scipy`.
+"""
+
+import argparse
+import pickle
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import scipy.sparse
+from fsspec import AbstractFileSystem
+from fsspec.implementations.dirfs import DirFileSystem
+from fsspec.implementations.local import LocalFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+
+from pydantic_cereal.codecs.cd_np import np_read, np_read_mmap, np_write
+from pydantic_cereal.codecs.cd_pa import pa_read, pa_write, pa_write_compressed
+from pydantic_cereal.codecs.cd_pkl import pkl_read, pkl_read_mmap, pkl_write
+from pydantic_cereal.codecs.cd_sp import sp_read, sp_write, sp_write_compressed
+from pydantic_cereal.examples.ex_pd import pd_read, pd_write
+
+Reader = Callable[[AbstractFileSystem, str], Any]
+Writer = Callable[[Any, AbstractFileSystem, str], Any]
+
+
+def pickle_write(obj: Any, fs: AbstractFileSystem, path: str) -> None:
+    """Write any object via pickle (the usual hand-written baseline)."""
+    with fs.open(path, mode="wb") as f:
+        pickle.dump(obj, f)
+
+
+def pickle_read(fs: AbstractFileSystem, path: str) -> Any:
+    """Read any object via pickle."""
+    with fs.open(path, mode="rb") as f:
+        return pickle.load(f)
+
+
+def pq_write(obj: pa.Table, fs: AbstractFileSystem, path: str) -> None:
+    """Write PyArrow table as Parquet (the generic path)."""
+    with fs.open(path, mode="wb") as f:
+        pq.write_table(obj, f)
+
+
+def pq_read(fs: AbstractFileSystem, path: str) -> pa.Table:
+    """Read PyArrow table from Parquet."""
+    with fs.open(path, mode="rb") as f:
+        return pq.read_table(f)
+
+
+def make_cases(rows: int) -> Dict[str, Tuple[Any, List[Tuple[str, Reader, Writer]]]]:
+    """Create objects and the codecs to compare for each of them."""
+    arr = np.random.default_rng(0).random((rows, 8))
+    df = pd.DataFrame(arr, columns=[f"c{i}" for i in range(arr.shape[1])])
+    tbl = pa.Table.from_pandas(df, preserve_index=False)
+    sparse = scipy.sparse.random(rows, 1000, density=0.001, format="csr", random_state=0)
+    return {
+        "ndarray": (
+            arr,
+            [
+                ("npy", np_read, np_write),
+                ("npy (mmap)", np_read_mmap, np_write),
+                ("pickle-5", pkl_read, pkl_write),
+                ("pickle-5 (mmap)", pkl_read_mmap, pkl_write),
+                ("pickle", pickle_read, pickle_write),
+            ],
+        ),
+        "DataFrame": (
+            df,
+            [
+                ("parquet", pd_read, pd_write),
+                ("pickle", pickle_read, pickle_write),
+            ],
+        ),
+        "Table": (
+            tbl,
+            [
+                ("arrow ipc", pa_read, pa_write),
+                ("arrow ipc (zstd)", pa_read, pa_write_compressed),
+                ("parquet", pq_read, pq_write),
+            ],
+        ),
+        "sparse": (
+            sparse,
+            [
+                ("npz", sp_read, sp_write),
+                ("npz (compressed)", sp_read, sp_write_compressed),
+                ("pickle", pickle_read, pickle_write),
+            ],
+        ),
+    }
+
+
+def bench(
+    fs: AbstractFileSystem, obj: Any, reader: Reader, writer: Writer, repeat: int
+) -> Tuple[float, float, int]:
+    """Return best write time, best read time and file size."""
+    t_write, t_read = float("inf"), float("inf")
+    size = 0
+    for i in range(repeat):
+        path = f"bench-{i}"
+        t0 = time.perf_counter()
+        writer(obj, fs, path)
+        t1 = time.perf_counter()
+        res = reader(fs, path)
+        if isinstance(res, np.ndarray) and not res.flags.owndata:
+            np.asarray(res).sum()  # touch (possibly memory-mapped) data, to compare fairly
+        t2 = time.perf_counter()
+        t_write, t_read = min(t_write, t1 - t0), min(t_read, t2 - t1)
+        size = fs.size(path)
+        fs.rm(path)
+    return t_write, t_read, size
+
+
+def main() -> None:
+    """Run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filesystems = {
+            "memory": DirFileSystem(path="/bench", fs=MemoryFileSystem()),
+            "local": DirFileSystem(path=tmp_dir, fs=LocalFileSystem()),
+        }
+        print(
+            f"{'fs':<8} {'type':<10} {'codec':<22} {'write, ms':>10} {'read, ms':>10} {'size, MB':>10}"
+        )
+        for fs_name, fs in filesystems.items():
+            for type_name, (obj, codecs) in make_cases(args.rows).items():
+                for codec_name, reader, writer in codecs:
+                    t_w, t_r, size = bench(fs, obj, reader, writer, args.repeat)
+                    print(
+                        f"{fs_name:<8} {type_name:<10} {codec_name:<22} "
+                        f"{t_w * 1e3:>10.1f} {t_r * 1e3:>10.1f} {size / 2**20:>10.1f}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,13 @@ __all__ = [
     "CerealRegistrationError",
     "Cereal",
     "CerealReader",
+    "CerealOptionsReader",
     "CerealWriter",
+    "CerealSplitter",
+    "CerealCombiner",
+    "SharedModel",
+    "IOPolicy",
+    "IOMetrics",
     "cereal_meta_schema",
     "__version__",
 ]
@@ -18,5 +24,16 @@ from .errors import (
     CerealProtocolError,
     CerealRegistrationError,
 )
-from .main import Cereal, CerealReader, CerealWriter, cereal_meta_schema
+from .main import (
+    Cereal,
+    CerealCombiner,
+    CerealOptionsReader,
+    CerealReader,
+    CerealSplitter,
+    CerealWriter,
+    IOMetrics,
+    IOPolicy,
+    SharedModel,
+    cereal_meta_schema,
+)
 from .version import __version__
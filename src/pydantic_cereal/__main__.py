@@ -0,0 +1,8 @@
+"""Command-line entry point: `python -m pydantic_cereal`."""
+
+import sys
+
+from ._cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+"""Command-line interface, for inspecting, benchmarking and profiling saved models.
+
+Usage: `python -m pydantic_cereal {inspect,bench,profile} PATH [options]`
+"""
+
+import argparse
+import base64
+import cProfile
+import io
+import json
+import pstats
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Optional, Sequence, TextIO, Tuple, Type
+
+from pydantic import BaseModel
+
+from ._metadata import CerealInfo, Location, find_cereal_info_locations
+from ._path_utils import append_path_parts
+from ._utils import import_object
+from .main import Cereal
+
+__all__ = ["main"]
+
+
+def _format_location(loc: Location) -> str:
+    """Format a location within the model data, such as `chunks.3`."""
+    return ".".join(str(part) for part in loc) or "<root>"
+
+
+def _format_time(seconds: float) -> str:
+    """Format a duration in milliseconds."""
+    return f"{seconds * 1e3:.2f} ms"
+
+
+def _format_table(rows: List[List[str]], header: List[str]) -> str:
+    """Format rows as an aligned plain-text table."""
+    widths = [max(len(str(x)) for x in col) for col in zip(header, *rows)]
+    lines = ["  ".join(str(x).ljust(w) for (x, w) in zip(row, widths)) for row in [header, *rows]]
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def _find_cereal(model_cls: type, cereal_import: Optional[str]) -> Cereal:
+    """Find the `Cereal` instance the model was registered with."""
+    if cereal_import is not None:
+        res = import_object(cereal_import)
+        if not isinstance(res, Cereal):
+            raise TypeError(f"{cereal_import!r} is not a Cereal object, but {type(res)!r}")
+        return res
+    # Look for the (global) Cereal object in the module where the model is defined
+    module = import_module(model_cls.__module__)
+    found = {id(v): v for v in vars(module).values() if isinstance(v, Cereal)}
+    if len(found) != 1:
+        raise ValueError(
+            f"Found {len(found)} Cereal objects in module {module.__name__!r}, please pass '--cereal'."
+        )
+    return list(found.values())[0]
+
+
+def _object_size(cereal: Cereal, info: CerealInfo) -> int:
+    """Get the stored size of an object (within an active context), including files of directories."""
+    if info.inline_data is not None:
+        return len(base64.b64decode(info.inline_data))
+    fs = cereal.fs
+    return sum(fs.du(path, total=True) for path in cereal._object_paths([info]))
+
+
+def _object_storage(info: CerealInfo) -> str:
+    """Describe how an object is stored."""
+    if info.inline_data is not None:
+        return "inline"
+    if info.shard_paths is not None:
+        return f"{len(info.shard_paths)} shards"
+    return "file"
+
+
+def _positive_int(value: str) -> int:
+    """Parse a positive integer argument."""
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return n
+
+
+def _timeit(func: Callable[[], Any], repeat: int) -> List[float]:
+    """Time a function, returning the durations of each repeat."""
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+# Subcommands
+
+
+def cmd_inspect(args: argparse.Namespace, out: TextIO) -> int:
+    """Print the manifest and per-object sizes of a saved model."""
+    cereal = Cereal()  # no types are registered, since we don't load the model
+    with cereal.context(target_path=args.path, fs=None):
+        fs = cereal.fs
+        model_raw = cereal._read_manifest()
+        files = {
+            name: fs.size(append_path_parts(fs, cereal.target_path, name))
+            for name in ["model.json", "model.schema.json"]
+            if fs.exists(append_path_parts(fs, cereal.target_path, name))
+        }
+        objects: List[Dict[str, Any]] = [
+            dict(
+                location=_format_location(loc),
+                storage=_object_storage(info),
+                size=_object_size(cereal, info),
+                object_path=info.object_path,
+                reader=info.cereal_reader,
+                writer=info.cereal_writer,
+                cereal_version=info.cereal_version,
+            )
+            for (loc, info) in find_cereal_info_locations(model_raw)
+        ]
+
+    if args.json:
+        report = {"class": model_raw.get("class"), "files": files, "objects": objects}
+        if args.manifest:
+            report["manifest"] = model_raw
+        json.dump(report, out, indent=2)
+        out.write("\n")
+        return 0
+
+    out.write(f"Model class: {model_raw.get('class')}\n")
+    for name, size in files.items():
+        out.write(f"{name}: {size} bytes\n")
+    total = sum(obj["size"] for obj in objects)
+    out.write(f"Objects: {len(objects)} ({total} bytes)\n")
+    if objects:
+        header = ["LOCATION", "STORAGE", "SIZE", "OBJECT_PATH", "READER"]
+        keys = ["location", "storage", "size", "object_path", "reader"]
+        out.write(_format_table([[str(obj[k]) for k in keys] for obj in objects], header) + "\n")
+    if args.manifest:
+        out.write(json.dumps(model_raw, indent=2) + "\n")
+    return 0
+
+
+def cmd_bench(args: argparse.Namespace, out: TextIO) -> int:
+    """Time model round trips, and per-object readers and writers."""
+    cereal, model_cls = _load_cereal(args)
+    results: Dict[str, List[float]] = {}
+
+    # Whole-model reads and writes
+    mdl = cereal.read_model(args.path, supercls=model_cls)  # also warms up imports
+    results["read_model"] = _timeit(
+        lambda: cereal.read_model(args.path, supercls=model_cls), args.repeat
+    )
+    write_times = []
+    for _ in range(args.repeat):
+        out_path = f"{args.out}/{uuid.uuid4().hex}"
+        write_times.extend(_timeit(lambda: cereal.write_model(mdl, out_path), 1))
+        _cleanup(cereal, out_path)
+    results["write_model"] = write_times
+
+    # Per-object readers and writers
+    out_path = f"{args.out}/{uuid.uuid4().hex}"
+    with cereal.context(target_path=args.path, fs=None):
+        located = find_cereal_info_locations(cereal._read_manifest())
+        loaded = []
+        for loc, info in located:
+            obj_name = _format_location(loc)
+            results[f"read {obj_name}"] = _timeit(lambda: cereal._load_from_meta(info), args.repeat)
+            loaded.append((obj_name, info, cereal._load_from_meta(info)))
+    with cereal.context(target_path=out_path, fs=None):
+        cereal.fs.makedirs(cereal.target_path, exist_ok=True)
+        for obj_name, info, obj in loaded:
+            f_writer, _ = cereal._normalize_writer(info.cereal_writer)
+            # NOTE: The splitter isn't saved, so sharded objects are timed as a single (unsharded) file
+            op_name = f"write {obj_name}" + (" (unsharded)" if info.shard_paths is not None else "")
+            results[op_name] = _timeit(lambda: cereal._write_obj(obj, f_writer), args.repeat)
+    _cleanup(cereal, out_path)
+
+    rows = [
+        [name, str(len(times)), _format_time(min(times)), _format_time(statistics.mean(times))]
+        for (name, times) in results.items()
+    ]
+    out.write(f"Model class: {model_cls.__module__}.{model_cls.__qualname__}\n")
+    out.write(_format_table(rows, ["OPERATION", "REPEAT", "MIN", "MEAN"]) + "\n")
+    # NOTE: Open options live in the wrapped types, which aren't known from the saved metadata
+    out.write("Per-object rows use default open options.\n")
+    return 0
+
+
+def cmd_profile(args: argparse.Namespace, out: TextIO) -> int:
+    """Profile model round trips under cProfile or tracemalloc, and write a report."""
+    cereal, model_cls = _load_cereal(args)
+    mdl = cereal.read_model(args.path, supercls=model_cls) if args.op == "write" else None
+    out_path = f"{args.out}/{uuid.uuid4().hex}"
+
+    def run() -> None:
+        """Run the profiled operation(s)."""
+        res = mdl
+        if args.op in ("read", "roundtrip"):
+            res = cereal.read_model(args.path, supercls=model_cls)
+        if args.op in ("write", "roundtrip"):
+            assert res is not None
+            cereal.write_model(res, out_path)
+
+    if args.mode == "cprofile":
+        prof = cProfile.Profile()
+        prof.enable()
+        try:
+            run()
+        finally:
+            prof.disable()
+        buf = io.StringIO()
+        pstats.Stats(prof, stream=buf).sort_stats(args.sort).print_stats(args.limit)
+        report = buf.getvalue()
+    else:
+        tracemalloc.start()
+        try:
+            run()
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        lines = [f"Current: {current} bytes", f"Peak: {peak} bytes", f"Top {args.limit} allocations:"]
+        lines.extend(str(stat) for stat in snapshot.statistics("lineno")[: args.limit])
+        report = "\n".join(lines) + "\n"
+    if args.op in ("write", "roundtrip"):
+        _cleanup(cereal, out_path)
+
+    if args.output is None:
+        out.write(report)
+    else:
+        with open(args.output, mode="w") as f:
+            f.write(report)
+        out.write(f"Wrote {args.mode} report to {args.output!r}\n")
+    return 0
+
+
+# Helpers
+
+
+def _load_cereal(args: argparse.Namespace) -> Tuple[Cereal, Type[BaseModel]]:
+    """Import the model class (from the manifest) and find its `Cereal` object."""
+    with Cereal().context(target_path=args.path, fs=None) as ctx:
+        model_raw = ctx.cereal._read_manifest()
+    model_cls = Cereal._get_model_class(model_raw, supercls=BaseModel)
+    return _find_cereal(model_cls, args.cereal), model_cls
+
+
+def _cleanup(cereal: Cereal, target_path: str) -> None:
+    """Remove a written model."""
+    with cereal.context(target_path=target_path, fs=None):
+        if cereal.fs.exists(cereal.target_path):
+            cereal.fs.rm(cereal.target_path, recursive=True)
+
+
+def make_parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m pydantic_cereal",
+        description="Inspect, benchmark and profile models saved with pydantic-cereal.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p_inspect = subparsers.add_parser("inspect", help="Print the manifest and object sizes.")
+    p_inspect.add_argument("path", help="Path or fsspec URI of the saved model.")
+    p_inspect.add_argument("--json", action="store_true", help="Print as JSON.")
+    p_inspect.add_argument("--manifest", action="store_true", help="Also print the full 'model.json'.")
+    p_inspect.set_defaults(func=cmd_inspect)
+
+    def add_model_args(sub: argparse.ArgumentParser) -> None:
+        """Add arguments for loading the model."""
+        sub.add_argument("path", help="Path or fsspec URI of the saved model.")
+        sub.add_argument(
+            "--cereal",
+            default=None,
+            help="Import string of the Cereal object, such as 'my_pkg.models.cereal'. "
+            "By default, it is searched for in the model's module.",
+        )
+        sub.add_argument(
+            "--out",
+            default="memory://pydantic-cereal-cli",
+            help="Path or fsspec URI to write temporary models to (default: in memory).",
+        )
+
+    p_bench = subparsers.add_parser("bench", help="Time model round trips and per-object I/O.")
+    add_model_args(p_bench)
+    p_bench.add_argument(
+        "--repeat", type=_positive_int, default=5, help="Number of repeats (default: 5)."
+    )
+    p_bench.set_defaults(func=cmd_bench)
+
+    p_profile = subparsers.add_parser("profile", help="Profile model round trips.")
+    add_model_args(p_profile)
+    p_profile.add_argument("--mode", choices=["cprofile", "tracemalloc"], default="cprofile")
+    p_profile.add_argument("--op", choices=["read", "write", "roundtrip"], default="roundtrip")
+    p_profile.add_argument("--sort", default="cumulative", help="cProfile sort key.")
+    p_profile.add_argument("--limit", type=int, default=30, help="Number of entries to report.")
+    p_profile.add_argument("--output", "-o", default=None, help="Report file (default: stdout).")
+    p_profile.set_defaults(func=cmd_profile)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None, out: Optional[TextIO] = None) -> int:
+    """Run the command-line interface."""
+    args = make_parser().parse_args(argv)
+    return args.func(args, sys.stdout if out is None else out)
@@ -1,3 +1,5 @@
+from typing import Any, List, Optional, Tuple, Union
+
 from pydantic import BaseModel
 
 from .version import __version__
@@ -12,7 +14,37 @@ class CerealInfo(BaseModel):
     cereal_writer: ImportString
     cereal_reader: ImportString
     object_path: str
+    shard_paths: Optional[List[str]] = None
+    """Paths of shards (relative to `object_path`), if the object was written in shards."""
+    cereal_combiner: Optional[ImportString] = None
+    """Combiner of shards, if the object was written in shards."""
+    inline_data: Optional[str] = None
+    """Base64-encoded object data, if the object is stored inline rather than at `object_path`."""
 
 
 cereal_meta_schema = CerealInfo.model_json_schema()
 """Metadata schema for pydantic-cereal metadata."""
+
+_cereal_info_keys = frozenset(
+    name for (name, fld) in CerealInfo.model_fields.items() if fld.is_required()
+)
+
+
+Location = Tuple[Union[str, int], ...]
+"""Location within raw model data, as a sequence of keys and indices."""
+
+
+def find_cereal_info_locations(raw: Any, loc: Location = ()) -> List[Tuple[Location, CerealInfo]]:
+    """Find all pydantic-cereal metadata (and their locations) within raw (JSON-like) model data."""
+    if isinstance(raw, dict):
+        if _cereal_info_keys.issubset(raw.keys()):
+            return [(loc, CerealInfo.model_validate(raw))]
+        return [res for (k, v) in raw.items() for res in find_cereal_info_locations(v, (*loc, k))]
+    if isinstance(raw, list):
+        return [res for (i, v) in enumerate(raw) for res in find_cereal_info_locations(v, (*loc, i))]
+    return []
+
+
+def find_cereal_infos(raw: Any) -> List[CerealInfo]:
+    """Find all pydantic-cereal metadata within raw (JSON-like) model data, in order of appearance."""
+    return [info for (_, info) in find_cereal_info_locations(raw)]
@@ -0,0 +1,178 @@
+"""Overlay file system, serving some files from already-loaded bytes."""
+
+import io
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Mapping, Optional, Union
+
+from fsspec import AbstractFileSystem
+
+from ._passthrough import PassthroughFileSystem
+
+__all__ = ["OverlaySource", "OverlayFileSystem", "BufferFile"]
+
+OverlaySource = Union[bytes, memoryview, "Future[bytes]"]
+
+
+class BufferFile(io.BufferedIOBase):
+    """Read-only file over a buffer, which doesn't copy the buffer (unlike `io.BytesIO`)."""
+
+    def __init__(self, buffer: Any) -> None:
+        super().__init__()
+        self._view = memoryview(buffer).cast("B")
+        self._pos = 0
+
+    def getbuffer(self) -> memoryview:
+        """Get the (whole) underlying buffer, without copying."""
+        return self._view
+
+    def readable(self) -> bool:
+        """Whether the file is readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Whether the file is seekable."""
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Change the position in the file."""
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence!r}")
+        self._pos = max(self._pos, 0)
+        return self._pos
+
+    def tell(self) -> int:
+        """Get the current position in the file."""
+        return self._pos
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """Read (at most) `size` bytes, or everything if `size` is negative."""
+        end = len(self._view) if (size is None or size < 0) else min(self._pos + size, len(self._view))
+        data = self._view[self._pos : end].tobytes()
+        self._pos = max(end, self._pos)
+        return data
+
+    read1 = read
+
+    def readinto(self, b: Any) -> int:
+        """Read bytes into a pre-allocated buffer."""
+        out = memoryview(b).cast("B")
+        n = max(min(len(out), len(self._view) - self._pos), 0)
+        out[:n] = self._view[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    readinto1 = readinto
+
+
+class OverlayFileSystem(PassthroughFileSystem):
+    """File system that serves some paths from pre-loaded bytes, and delegates everything else.
+
+    Each pre-loaded file is served (at most) once, then dropped to free memory; later reads of the
+    same path, as well as failed background fetches, fall back to the underlying file system.
+    Checking a pre-loaded file (e.g. via `exists`, `info` or `size`) doesn't drop it.
+    """
+
+    def __init__(self, fs: AbstractFileSystem, overlay: Optional[Mapping[str, OverlaySource]] = None):
+        super().__init__(fs)
+        self._overlay: Dict[str, OverlaySource] = dict(overlay or {})
+        self._overlay_lock = threading.Lock()
+
+    def is_overlaid(self, path: str) -> bool:
+        """Whether the path (still) has pre-loaded data."""
+        return path in self._overlay
+
+    @staticmethod
+    def _resolve(src: Optional[OverlaySource]) -> Optional[Union[bytes, memoryview]]:
+        """Get the data of an overlay source, waiting for it if it's still being fetched."""
+        if isinstance(src, Future):
+            try:
+                return src.result()
+            except Exception:
+                return None  # let the underlying file system raise a proper error
+        return src
+
+    def _take(self, path: str) -> Optional[Union[bytes, memoryview]]:
+        """Take the pre-loaded data for the path, if available."""
+        with self._overlay_lock:
+            src = self._overlay.pop(path, None)
+        return self._resolve(src)
+
+    def _peek(self, path: str) -> Optional[Union[bytes, memoryview]]:
+        """Get the pre-loaded data for the path (without dropping it), if available."""
+        return self._resolve(self._overlay.get(path))
+
+    def open(self, path: str, mode: str = "rb", *args: Any, **kwargs: Any) -> Any:
+        """Open a file, using pre-loaded data if available."""
+        if mode in ("rb", "r") and path in self._overlay:
+            data = self._take(path)
+            if data is not None:
+                f = BufferFile(data)
+                if mode == "rb":
+                    return f
+                return io.TextIOWrapper(
+                    f,  # type: ignore[arg-type]
+                    encoding=kwargs.get("encoding"),
+                    errors=kwargs.get("errors"),
+                    newline=kwargs.get("newline"),
+                )
+        return super().open(path, mode, *args, **kwargs)
+
+    def take_buffer(self, path: str) -> Optional[memoryview]:
+        """Take the pre-loaded data for the path as a buffer (without copying), if available."""
+        if path not in self._overlay:
+            return None
+        data = self._take(path)
+        return None if data is None else memoryview(data)
+
+    def cat_file(
+        self, path: str, start: Optional[int] = None, end: Optional[int] = None, **kwargs: Any
+    ) -> bytes:
+        """Get file contents, using pre-loaded data if available."""
+        if path in self._overlay:
+            data = self._take(path)
+            if data is not None:
+                return bytes(data[start:end])
+        return super().cat_file(path, start=start, end=end, **kwargs)
+
+    def cat(self, path: Any, *args: Any, **kwargs: Any) -> Any:
+        """Get the contents of file(s), using pre-loaded data if available."""
+        if isinstance(path, str) and (path in self._overlay):
+            data = self._take(path)
+            if data is not None:
+                return bytes(data)
+        elif isinstance(path, list) and any(p in self._overlay for p in path):
+            res = {p: self.cat_file(p) for p in path if p in self._overlay}
+            rest = [p for p in path if p not in res]
+            if rest:
+                res.update(super().cat(rest, *args, **kwargs))
+            return res
+        return super().cat(path, *args, **kwargs)
+
+    def info(self, path: str, **kwargs: Any) -> Dict[str, Any]:
+        """Get information about a file, using pre-loaded data if available."""
+        data = self._peek(path) if path in self._overlay else None
+        if data is not None:
+            return {"name": path, "size": memoryview(data).nbytes, "type": "file"}
+        return super().info(path, **kwargs)
+
+    def size(self, path: str) -> Optional[int]:
+        """Get the size of a file in bytes, using pre-loaded data if available."""
+        data = self._peek(path) if path in self._overlay else None
+        if data is not None:
+            return memoryview(data).nbytes
+        return super().size(path)
+
+    def exists(self, path: str, **kwargs: Any) -> bool:
+        """Check whether a path exists, including pre-loaded files."""
+        return (path in self._overlay) or super().exists(path, **kwargs)
+
+    def isfile(self, path: str) -> bool:
+        """Check whether a path is a file, including pre-loaded files."""
+        return (path in self._overlay) or super().isfile(path)
@@ -0,0 +1,20 @@
+"""Base class for file systems that wrap another one, passing paths through as-is."""
+
+from fsspec import AbstractFileSystem
+from fsspec.implementations.dirfs import DirFileSystem
+
+__all__ = ["PassthroughFileSystem"]
+
+
+class PassthroughFileSystem(DirFileSystem):
+    """File system that delegates everything to the wrapped one, with the same paths.
+
+    Subclasses override the methods they change. Instances are never cached by fsspec, since their
+    state (such as pre-loaded data or options) is not part of the fsspec instance token.
+    """
+
+    cachable = False
+
+    def __init__(self, fs: AbstractFileSystem):
+        super().__init__(path=fs.sep, fs=fs)
+        self.path = ""  # no root, so paths are passed as-is to the underlying file system
@@ -1,6 +1,15 @@
 """Universal path utilities."""
 
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
 from fsspec import AbstractFileSystem
+from fsspec.implementations.dirfs import DirFileSystem
+from fsspec.implementations.local import LocalFileSystem
+
+from ._overlay import OverlayFileSystem
+from ._spill import SpillFileSystem
 
 
 def ensure_empty_dir(fs: AbstractFileSystem, workdir: str) -> str:
@@ -17,3 +26,48 @@ def ensure_empty_dir(fs: AbstractFileSystem, workdir: str) -> str:
 def append_path_parts(fs: AbstractFileSystem, path_base: str, *path_parts: str) -> str:
     """Append parts to a path given filesystem."""
     return str(fs.sep).join([path_base, *path_parts])
+
+
+def get_local_path(fs: AbstractFileSystem, path: str) -> Optional[str]:
+    """Get the path on local disk, if the file system is local (or a directory within one)."""
+    if isinstance(fs, OverlayFileSystem) and fs.is_overlaid(path):
+        return None  # the data is already in memory
+    if isinstance(fs, SpillFileSystem) and (path == fs.spill_path):
+        return None  # the data may be kept in memory
+    if isinstance(fs, LocalFileSystem):
+        return fs._strip_protocol(path)
+    if isinstance(fs, DirFileSystem):
+        return get_local_path(fs.fs, fs._join(path))
+    return None
+
+
+def take_buffer(fs: AbstractFileSystem, path: str) -> Optional[memoryview]:
+    """Take the file's data as a buffer, if it is already in memory (e.g. prefetched or shared).
+
+    The data is then no longer held by the file system, so this should be read only once.
+    """
+    if isinstance(fs, OverlayFileSystem):
+        return fs.take_buffer(path)
+    if isinstance(fs, DirFileSystem):
+        return take_buffer(fs.fs, fs._join(path))
+    return None
+
+
+def copy_between(
+    src_fs: AbstractFileSystem,
+    src_paths: List[str],
+    dst_fs: AbstractFileSystem,
+    dst_paths: List[str],
+    *,
+    max_workers: Optional[int] = None,
+    block_size: int = 2**22,
+) -> None:
+    """Copy files between (different) file systems, streaming them in parallel."""
+
+    def copy_one(src_path: str, dst_path: str) -> None:
+        with src_fs.open(src_path, mode="rb") as f_src, dst_fs.open(dst_path, mode="wb") as f_dst:
+            shutil.copyfileobj(f_src, f_dst, length=block_size)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for fut in [executor.submit(copy_one, s, d) for (s, d) in zip(src_paths, dst_paths)]:
+            fut.result()
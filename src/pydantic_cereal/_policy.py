@@ -0,0 +1,153 @@
+"""I/O policy for reader and writer calls: timeouts, retries and hedged reads."""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Literal, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+__all__ = ["IOPolicy", "IOMetrics", "run_with_policy"]
+
+T = TypeVar("T")
+
+IOOperation = Literal["read", "write"]
+
+
+class IOPolicy(BaseModel):
+    """Policy for calling readers and writers, per object (or shard).
+
+    By default, each reader and writer is called once, in the calling thread.
+
+    Note
+    ----
+    Python threads can't be cancelled, so a call that timed out (or lost a hedged race) is abandoned
+    and keeps running in the background until it finishes. Writes (including shards) are retried with
+    a new file name, so an abandoned write can't clobber a retried one.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    timeout: Optional[float] = Field(default=None, gt=0)
+    """Timeout for each call, in seconds. A call that times out raises `TimeoutError`."""
+
+    retries: int = Field(default=0, ge=0)
+    """Number of retries after a failed (or timed-out) call."""
+
+    backoff: float = Field(default=0.1, ge=0)
+    """Delay before the first retry, in seconds."""
+
+    backoff_factor: float = Field(default=2.0, ge=1)
+    """Factor to increase the delay by, for each following retry."""
+
+    max_backoff: float = Field(default=10.0, ge=0)
+    """Maximum delay between retries, in seconds."""
+
+    retry_on: Tuple[Type[Exception], ...] = (OSError,)
+    """Errors that are retried (`TimeoutError` is an `OSError`)."""
+
+    no_retry_on: Tuple[Type[Exception], ...] = (
+        FileNotFoundError,
+        FileExistsError,
+        IsADirectoryError,
+        NotADirectoryError,
+        PermissionError,
+    )
+    """Errors that are not retried, even if they are in `retry_on` (since retrying won't help)."""
+
+    retry_writes: bool = True
+    """Whether to retry writes too. Writers must then overwrite partially-written files."""
+
+    hedge_after: Optional[float] = Field(default=None, gt=0)
+    """If set, a duplicate read is started once a read takes longer than this many seconds,
+    and the first one to succeed is used."""
+
+
+class IOMetrics(object):
+    """Thread-safe counters of reader and writer calls, and of how the `IOPolicy` handled them.
+
+    Counters are named `"<operation>.<event>"`, where the operation is `read` or `write`, and events are:
+    `calls`, `retries`, `timeouts`, `failures` (after all retries), `hedges` (duplicate reads started)
+    and `hedge_wins` (duplicate reads that finished first).
+    """
+
+    def __init__(self) -> None:
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"{type(self).__qualname__}({self.as_dict()!r})"
+
+    def add(self, op: IOOperation, event: str, n: int = 1) -> None:
+        """Increase a counter."""
+        key = f"{op}.{event}"
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + n
+
+    def as_dict(self) -> Dict[str, int]:
+        """Get a copy of the (non-zero) counters."""
+        with self._lock:
+            return dict(sorted(self._counts.items()))
+
+    def reset(self) -> None:
+        """Set all counters to zero."""
+        with self._lock:
+            self._counts.clear()
+
+
+def _run_attempt(func: Callable[[], T], policy: IOPolicy, metrics: IOMetrics, op: IOOperation) -> T:
+    """Run a single attempt, with a timeout and hedging (if enabled)."""
+    hedge_after = policy.hedge_after if op == "read" else None
+    if (policy.timeout is None) and (hedge_after is None):
+        return func()
+
+    deadline = None if policy.timeout is None else time.monotonic() + policy.timeout
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pydantic-cereal-io")
+    try:
+        first = executor.submit(func)
+        pending = {first}
+        if (hedge_after is not None) and ((policy.timeout is None) or (hedge_after < policy.timeout)):
+            done, _ = wait(pending, timeout=hedge_after)
+            if not done:
+                metrics.add(op, "hedges")
+                pending.add(executor.submit(func))
+
+        failed: Optional[Future] = None
+        while pending:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            if not done:
+                metrics.add(op, "timeouts")
+                raise TimeoutError(f"I/O {op} timed out after {policy.timeout} seconds.")
+            for fut in done:
+                if fut.exception() is None:
+                    if fut is not first:
+                        metrics.add(op, "hedge_wins")
+                    return fut.result()
+                failed = fut
+        assert failed is not None
+        return failed.result()  # raises the error
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_with_policy(func: Callable[[], T], policy: IOPolicy, metrics: IOMetrics, op: IOOperation) -> T:
+    """Run a reader or writer call (without arguments) according to the policy."""
+    metrics.add(op, "calls")
+    retries = policy.retries if (op == "read" or policy.retry_writes) else 0
+    delay = policy.backoff
+    for attempt in range(retries + 1):
+        try:
+            return _run_attempt(func, policy, metrics, op)
+        except policy.retry_on as err:
+            if (attempt >= retries) or isinstance(err, policy.no_retry_on):
+                metrics.add(op, "failures")
+                raise
+        except Exception:
+            metrics.add(op, "failures")
+            raise
+        metrics.add(op, "retries")
+        time.sleep(min(delay, policy.max_backoff))
+        delay *= policy.backoff_factor
+    raise AssertionError("unreachable")
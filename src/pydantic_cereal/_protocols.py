@@ -1,8 +1,18 @@
 """Protocols and helpers for reader/writier objects."""
 
+import functools
 import inspect
 from abc import abstractmethod
-from typing import Any, Protocol, TypeVar, Union, runtime_checkable
+from typing import (
+    Any,
+    List,
+    Mapping,
+    Protocol,
+    Sequence,
+    TypeVar,
+    Union,
+    runtime_checkable,
+)
 
 from fsspec import AbstractFileSystem
 
@@ -11,16 +21,25 @@ from .errors import CerealProtocolError
 
 __all__ = [
     "CerealReader",
+    "CerealOptionsReader",
     "CerealWriter",
+    "CerealSplitter",
+    "CerealCombiner",
     "ReaderLike",
     "WriterLike",
+    "SplitterLike",
+    "CombinerLike",
+    "bind_reader_options",
     "normalize_reader",
     "normalize_writer",
+    "normalize_splitter",
+    "normalize_combiner",
 ]
 
 
 T_read = TypeVar("T_read", covariant=True)
 T_write = TypeVar("T_write", contravariant=True)
+T_shard = TypeVar("T_shard")
 
 
 @runtime_checkable
@@ -32,6 +51,19 @@ class CerealReader(Protocol[T_read]):
         """Read data from the given path within the filesystem."""
 
 
+@runtime_checkable
+class CerealOptionsReader(Protocol[T_read]):
+    """Reader class for a particular type, which also accepts read options.
+
+    Read options are passed as keyword arguments (for example, `columns` for dataframes),
+    via `read_options` in [`Cereal.read_model()`][pydantic_cereal.Cereal.read_model].
+    """
+
+    @abstractmethod
+    def __call__(self, fs: AbstractFileSystem, path: str, **options: Any) -> T_read:
+        """Read data from the given path within the filesystem, using the given options."""
+
+
 @runtime_checkable
 class CerealWriter(Protocol[T_write]):
     """Writer class for a particular type."""
@@ -41,8 +73,28 @@ class CerealWriter(Protocol[T_write]):
         """Write data to the given path within the filesystem."""
 
 
+@runtime_checkable
+class CerealSplitter(Protocol[T_shard]):
+    """Splitter of an object into shards, for sharded writing."""
+
+    @abstractmethod
+    def __call__(self, obj: T_shard, n_shards: int) -> Sequence[T_shard]:
+        """Split the object into (at most) `n_shards` parts."""
+
+
+@runtime_checkable
+class CerealCombiner(Protocol[T_shard]):
+    """Combiner of shards back into a single object, for sharded reading."""
+
+    @abstractmethod
+    def __call__(self, shards: List[T_shard]) -> T_shard:
+        """Combine the shards (in original order) into a single object."""
+
+
 ReaderLike = Union[CerealReader, str]
 WriterLike = Union[CerealWriter, str]
+SplitterLike = Union[CerealSplitter, str]
+CombinerLike = Union[CerealCombiner, str]
 
 
 def normalize_reader(reader: ReaderLike) -> CerealReader:
@@ -91,3 +143,61 @@ def normalize_writer(writer: WriterLike) -> CerealWriter:
         ) from why
     # TODO: More checking?
     return writer
+
+
+def normalize_splitter(splitter: SplitterLike) -> CerealSplitter:
+    """Ensure the object passed is a splitter."""
+    # Load splitter, if passed as string
+    if isinstance(splitter, str):
+        splitter = import_object(splitter)
+
+    # Ensure callable
+    if not callable(splitter):
+        raise CerealProtocolError(
+            "Splitter must be a function or callable (or a string that imports as such)."
+        )
+
+    # Check signature
+    sig = inspect.signature(splitter)
+    try:
+        sig.bind("obj", "n_shards")
+    except TypeError as why:
+        raise CerealProtocolError(
+            f"Splitter must be callable with an object and number of shards, got signature: {sig!s}"
+        ) from why
+    return splitter
+
+
+def normalize_combiner(combiner: CombinerLike) -> CerealCombiner:
+    """Ensure the object passed is a combiner."""
+    # Load combiner, if passed as string
+    if isinstance(combiner, str):
+        combiner = import_object(combiner)
+
+    # Ensure callable
+    if not callable(combiner):
+        raise CerealProtocolError(
+            "Combiner must be a function or callable (or a string that imports as such)."
+        )
+
+    # Check signature
+    sig = inspect.signature(combiner)
+    try:
+        sig.bind("shards")
+    except TypeError as why:
+        raise CerealProtocolError(
+            f"Combiner must be callable with a list of shards, got signature: {sig!s}"
+        ) from why
+    return combiner
+
+
+def bind_reader_options(reader: CerealReader, options: Mapping[str, Any]) -> CerealReader:
+    """Bind read options to the reader, ensuring it accepts them."""
+    sig = inspect.signature(reader)
+    try:
+        sig.bind("fs", "path", **options)
+    except TypeError as why:
+        raise CerealProtocolError(
+            f"Reader doesn't accept read options {sorted(options)!r}, got signature: {sig!s}"
+        ) from why
+    return functools.partial(reader, **options)
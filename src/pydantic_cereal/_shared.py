@@ -0,0 +1,168 @@
+"""Sharing of preloaded model files between processes, via shared memory."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple
+
+from fsspec import AbstractFileSystem
+
+__all__ = ["SharedModel"]
+
+
+def _attach_segment(name: str) -> SharedMemory:
+    """Attach to an existing shared memory segment, without taking ownership of it."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # NOTE: Before Python 3.13, this also registers the segment with the resource tracker, which is
+    #   harmless in child processes (they share the creating process's tracker).
+    return SharedMemory(name=name)
+
+
+def _load_segment(fs: AbstractFileSystem, path: str) -> Tuple[SharedMemory, int]:
+    """Read a file into a new shared memory segment."""
+    size = fs.size(path)
+    shm = SharedMemory(create=True, size=max(size, 1))  # zero-size segments are not allowed
+    try:
+        with shm.buf[:size] as view, fs.open(path, mode="rb") as f:
+            pos = 0
+            while pos < size:
+                n = f.readinto(view[pos:])
+                if not n:
+                    raise EOFError(f"File {path!r} is shorter than expected ({pos} of {size} bytes).")
+                pos += n
+    except BaseException:
+        shm.unlink()
+        try:
+            shm.close()
+        except BufferError:
+            pass  # a view is still referenced (e.g. by the traceback), so it's closed when collected
+        raise
+    return shm, size
+
+
+class SharedModel(object):
+    """Files of a saved model, preloaded into shared memory.
+
+    This is created by [`Cereal.preload_model()`][pydantic_cereal.Cereal.preload_model] and read by
+    [`Cereal.attach_model()`][pydantic_cereal.Cereal.attach_model]. It can be pickled and sent to
+    other processes; only the process that created it owns (and should `unlink()`) the memory.
+    """
+
+    def __init__(
+        self,
+        manifest: Dict[str, Any],
+        fs: AbstractFileSystem,
+        target_path: str,
+        segments: Dict[str, Tuple[str, int]],
+    ) -> None:
+        self._manifest = manifest
+        self._fs = fs
+        self._target_path = target_path
+        self._segments = segments
+        self._shms: Dict[str, SharedMemory] = {}  # attached segments
+        self._owned: Dict[str, SharedMemory] = {}  # created segments, if this is the owner
+
+    @classmethod
+    def create(
+        cls,
+        manifest: Dict[str, Any],
+        fs: AbstractFileSystem,
+        target_path: str,
+        paths: List[str],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> "SharedModel":
+        """Read the files at the paths into shared memory (in parallel)."""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_load_segment, fs, path) for path in paths]
+        shms: Dict[str, SharedMemory] = {}
+        segments: Dict[str, Tuple[str, int]] = {}
+        errors = [fut.exception() for fut in futures if fut.exception() is not None]
+        for path, fut in zip(paths, futures):
+            if fut.exception() is None:
+                shm, size = fut.result()
+                if errors:
+                    shm.close()
+                    shm.unlink()
+                else:
+                    shms[path] = shm
+                    segments[path] = (shm.name, size)
+        if errors:
+            raise errors[0]  # type: ignore[misc]
+        res = cls(manifest, fs, target_path, segments)
+        res._shms = dict(shms)
+        res._owned = shms
+        return res
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        """Raw model data."""
+        return self._manifest
+
+    @property
+    def fs(self) -> AbstractFileSystem:
+        """File system the model was read from."""
+        return self._fs
+
+    @property
+    def target_path(self) -> str:
+        """Path the model was read from."""
+        return self._target_path
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the preloaded files."""
+        return sum(size for (_, size) in self._segments.values())
+
+    def attach(self) -> Dict[str, memoryview]:
+        """Attach to the shared memory, returning read-only buffers of the files' data per path."""
+        for path, (name, _) in self._segments.items():
+            if path not in self._shms:
+                self._shms[path] = _attach_segment(name)
+        return {
+            path: self._shms[path].buf[:size].toreadonly()
+            for (path, (_, size)) in self._segments.items()
+        }
+
+    def close(self) -> None:
+        """Detach from the shared memory in this process.
+
+        Objects that use the shared memory directly must be deleted before this.
+        """
+        for shm in self._shms.values():
+            shm.close()
+        self._shms = {}
+
+    def unlink(self) -> None:
+        """Free the shared memory (in the owning process), after closing it."""
+        self.close()
+        for shm in self._owned.values():
+            shm.close()
+            shm.unlink()
+        self._owned = {}
+
+    def __enter__(self) -> "SharedModel":
+        """Use as a context manager, which unlinks the memory on exit."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Free the shared memory."""
+        self.unlink()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get state for pickling (only references to the shared memory, which isn't owned)."""
+        return dict(
+            manifest=self._manifest,
+            fs=self._fs,
+            target_path=self._target_path,
+            segments=self._segments,
+        )
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Set state from unpickling."""
+        self.__init__(**state)  # type: ignore[misc]
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"{type(self).__qualname__}({self._target_path!r}, files={len(self._segments)})"
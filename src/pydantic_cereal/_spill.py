@@ -0,0 +1,110 @@
+"""Spilling file system, keeping a small written file in memory."""
+
+import io
+from typing import Any, Optional
+
+from fsspec import AbstractFileSystem
+
+from ._passthrough import PassthroughFileSystem
+
+__all__ = ["SpillFileSystem"]
+
+
+class _SpillFile(io.RawIOBase):
+    """Write-only file that is kept in memory until it exceeds a threshold, then spills to a target."""
+
+    def __init__(self, owner: "SpillFileSystem", **open_kwargs: Any) -> None:
+        super().__init__()
+        self._owner = owner
+        self._open_kwargs = open_kwargs
+        self._buf: Optional[io.BytesIO] = io.BytesIO()
+        self._target: Any = None
+
+    def writable(self) -> bool:
+        """Whether the file is writable."""
+        return True
+
+    def write(self, b: Any) -> int:  # type: ignore[override]
+        """Write bytes, spilling to the target file if the threshold is exceeded."""
+        if self._buf is not None:
+            if self._buf.tell() + memoryview(b).nbytes <= self._owner.threshold:
+                return self._buf.write(b)
+            self._target = self._owner.fs.open(self._owner.spill_path, mode="wb", **self._open_kwargs)
+            self._target.write(self._buf.getvalue())
+            self._buf = None
+        return self._target.write(b)
+
+    def tell(self) -> int:
+        """Get the current position in the file."""
+        if self._buf is not None:
+            return self._buf.tell()
+        return self._target.tell()
+
+    def close(self) -> None:
+        """Close the file, keeping the data in memory if it didn't spill."""
+        if not self.closed:
+            if self._buf is not None:
+                self._owner._keep(self._buf.getvalue())
+            else:
+                self._target.close()
+        super().close()
+
+
+class SpillFileSystem(PassthroughFileSystem):
+    """File system that keeps a single file in memory, if it's written in full below a threshold.
+
+    Writing anything else (or spilling the file) goes through to the underlying file system.
+    After writing, `finish()` returns the file's data, if it was kept in memory (i.e. never written).
+    """
+
+    def __init__(self, fs: AbstractFileSystem, spill_path: str, threshold: int):
+        super().__init__(fs)
+        self.spill_path = spill_path
+        self.threshold = threshold
+        self._kept: Optional[bytes] = None
+        self._other_writes = False
+
+    def finish(self) -> Optional[bytes]:
+        """Finish writing, and get the data of the file if it was kept in memory only."""
+        if self._other_writes and (self._kept is not None):
+            # Something else was written as well, so don't split the object up - write it out
+            self.fs.pipe_file(self.spill_path, self._kept)
+            self._kept = None
+        return self._kept
+
+    def _keep(self, data: bytes) -> None:
+        """Keep the data of the file in memory."""
+        self._kept = data
+
+    def open(self, path: str, mode: str = "rb", *args: Any, **kwargs: Any) -> Any:
+        """Open a file, keeping it in memory if it's the spill path and small enough."""
+        if mode in ("wb", "w") and path == self.spill_path:
+            text_kwargs = {k: kwargs.pop(k) for k in ("encoding", "errors", "newline") if k in kwargs}
+            raw = _SpillFile(self, **kwargs)
+            if mode == "wb":
+                return raw
+            return io.TextIOWrapper(io.BufferedWriter(raw), **text_kwargs)
+        if "r" not in mode:
+            self._other_writes = True
+        return super().open(path, mode, *args, **kwargs)
+
+    def pipe_file(self, path: str, value: bytes, *args: Any, **kwargs: Any) -> None:
+        """Set the contents of a file, keeping it in memory if it's the spill path and small enough."""
+        if path == self.spill_path and len(value) <= self.threshold:
+            self._keep(bytes(value))
+            return
+        if path != self.spill_path:
+            self._other_writes = True
+        return super().pipe_file(path, value, *args, **kwargs)
+
+    def pipe(self, path: Any, value: Optional[bytes] = None, **kwargs: Any) -> None:
+        """Put value(s) into path(s)."""
+        if isinstance(path, str):
+            assert value is not None
+            return self.pipe_file(path, value, **kwargs)
+        self._other_writes = True
+        return super().pipe(path, value, **kwargs)
+
+    def write_text(self, path: str, value: str, *args: Any, **kwargs: Any) -> Any:
+        """Write text to a file (via `open`, so the spill path can be kept in memory)."""
+        return AbstractFileSystem.write_text(self, path, value, *args, **kwargs)
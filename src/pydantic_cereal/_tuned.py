@@ -0,0 +1,27 @@
+"""Tuned file system, applying default options (such as block size and caching) when opening files."""
+
+from typing import Any, Dict, Mapping
+
+from fsspec import AbstractFileSystem
+
+from ._passthrough import PassthroughFileSystem
+
+__all__ = ["TunedFileSystem"]
+
+
+class TunedFileSystem(PassthroughFileSystem):
+    """File system that passes default options to `open()`, and delegates everything else.
+
+    Options given explicitly to `open()` take precedence. Readers and writers can inspect the
+    options via `open_options`, for instance to pick a buffer size.
+    """
+
+    def __init__(self, fs: AbstractFileSystem, open_options: Mapping[str, Any]):
+        super().__init__(fs)
+        self.open_options: Dict[str, Any] = dict(open_options)
+
+    def open(self, path: str, mode: str = "rb", *args: Any, **kwargs: Any) -> Any:
+        """Open a file, using the default options unless they are given."""
+        if not args:
+            kwargs = {**self.open_options, **kwargs}
+        return super().open(path, mode, *args, **kwargs)
@@ -0,0 +1,10 @@
+"""Built-in readers and writers ("codecs") for common scientific types.
+
+Each submodule requires its respective optional dependency:
+
+- [`cd_np`][pydantic_cereal.codecs.cd_np]: NumPy arrays, as `.npy` files (memory-mappable on local disk).
+- [`cd_pa`][pydantic_cereal.codecs.cd_pa]: PyArrow tables, as Arrow IPC (Feather V2) files (zero-copy).
+- [`cd_sp`][pydantic_cereal.codecs.cd_sp]: SciPy sparse matrices and arrays, as `.npz` files.
+- [`cd_pkl`][pydantic_cereal.codecs.cd_pkl]: Arbitrary Python objects, as pickle protocol 5 with
+  out-of-band buffers (memory-mappable on local disk). No extra dependencies.
+"""
@@ -0,0 +1,89 @@
+"""NumPy array codec, using the `.npy` format.
+
+Usage
+-----
+```python
+import numpy as np
+from pydantic_cereal.codecs.cd_np import np_read, np_write
+
+NumpyArray = cereal.wrap_type(np.ndarray, reader=np_read, writer=np_write)
+```
+
+Use `np_read_mmap` as the reader to memory-map arrays that are stored on a local disk.
+"""
+
+import io
+from typing import TYPE_CHECKING, Any, Optional, Type
+
+import numpy as np
+from fsspec import AbstractFileSystem
+
+from .._path_utils import get_local_path, take_buffer
+
+if TYPE_CHECKING:
+    from ..main import Cereal
+
+__all__ = ["np_read", "np_read_mmap", "np_write", "np_wrap"]
+
+_MAX_HEADER_SIZE = 10_000 + 12  # NumPy's default header size limit, plus magic string and lengths
+
+
+def np_write(obj: np.ndarray, fs: AbstractFileSystem, path: str) -> None:
+    """Write NumPy array (as `.npy`) to a path within a filesystem."""
+    with fs.open(path, mode="wb") as f:
+        np.save(f, obj, allow_pickle=False)
+
+
+def np_read(fs: AbstractFileSystem, path: str) -> np.ndarray:
+    """Read NumPy array (from `.npy`) from a path within a filesystem.
+
+    The array is writable. On file systems other than local disk, the file is fetched in a single
+    request and copied once into a writable buffer; use `np_read_mmap` to avoid that copy.
+    """
+    local_path = get_local_path(fs, path)
+    if local_path is not None:
+        return np.load(local_path, allow_pickle=False)
+    # NOTE: `bytes` are read-only, so copy them once - the array then uses the copy as-is
+    return _array_from_buffer(bytearray(fs.cat_file(path)))
+
+
+def np_read_mmap(fs: AbstractFileSystem, path: str) -> np.ndarray:
+    """Read NumPy array (from `.npy`), mapping it without copying (read-only) where possible.
+
+    Arrays on local disk are memory-mapped, and arrays already in memory (e.g. in shared memory via
+    `Cereal.attach_model`) are used as-is. On other file systems, this is the same as `np_read`.
+    """
+    local_path = get_local_path(fs, path)
+    if local_path is not None:
+        return np.load(local_path, mmap_mode="r", allow_pickle=False)
+    buf = take_buffer(fs, path)
+    if buf is not None:
+        arr = _array_from_buffer(buf)
+        arr.flags.writeable = False
+        return arr
+    return np_read(fs, path)
+
+
+def np_wrap(cereal: "Cereal", *, mmap: bool = False) -> Type[np.ndarray]:
+    """Wrap `np.ndarray` for the given `cereal` with the `.npy` codec."""
+    reader = np_read_mmap if mmap else np_read
+    return cereal.wrap_type(np.ndarray, reader=reader, writer=np_write)
+
+
+def _array_from_buffer(buf: Any) -> np.ndarray:
+    """Create an array from `.npy` data in a buffer, without copying the data."""
+    view = memoryview(buf)
+    head = io.BytesIO(view[:_MAX_HEADER_SIZE])
+    version = np.lib.format.read_magic(head)
+    header: Optional[tuple] = None
+    if version == (1, 0):
+        header = np.lib.format.read_array_header_1_0(head)
+    elif version == (2, 0):
+        header = np.lib.format.read_array_header_2_0(head)
+    if header is None:
+        # Rare format version - let NumPy handle it, with copying
+        return np.load(io.BytesIO(view), allow_pickle=False)
+    shape, fortran_order, dtype = header
+    count = int(np.prod(shape, dtype=np.int64))
+    arr = np.frombuffer(view, dtype=dtype, count=count, offset=head.tell())
+    return arr.reshape(shape, order="F" if fortran_order else "C")
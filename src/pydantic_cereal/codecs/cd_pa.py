@@ -0,0 +1,72 @@
+"""PyArrow table codec, using the Arrow IPC file format (also known as Feather V2).
+
+Usage
+-----
+```python
+import pyarrow as pa
+from pydantic_cereal.codecs.cd_pa import pa_read, pa_write
+
+ArrowTable = cereal.wrap_type(pa.Table, reader=pa_read, writer=pa_write)
+```
+
+The default writer doesn't compress data, so that tables on local disk are memory-mapped
+and read without copying. Use `pa_write_compressed` to trade decoding time for smaller files.
+"""
+
+from typing import TYPE_CHECKING, List, Optional, Type
+
+import pyarrow as pa
+import pyarrow.ipc
+from fsspec import AbstractFileSystem
+
+from .._path_utils import get_local_path, take_buffer
+
+if TYPE_CHECKING:
+    from ..main import Cereal
+
+__all__ = ["pa_read", "pa_write", "pa_write_compressed", "pa_wrap"]
+
+
+def _write_ipc(obj: pa.Table, fs: AbstractFileSystem, path: str, compression: Optional[str]) -> None:
+    """Write PyArrow table as an Arrow IPC file."""
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with fs.open(path, mode="wb") as f:
+        with pa.ipc.new_file(f, obj.schema, options=options) as writer:
+            writer.write_table(obj)
+
+
+def pa_write(obj: pa.Table, fs: AbstractFileSystem, path: str) -> None:
+    """Write PyArrow table (as uncompressed Arrow IPC) to a path within a filesystem."""
+    _write_ipc(obj, fs, path, compression=None)
+
+
+def pa_write_compressed(obj: pa.Table, fs: AbstractFileSystem, path: str) -> None:
+    """Write PyArrow table (as ZSTD-compressed Arrow IPC) to a path within a filesystem."""
+    _write_ipc(obj, fs, path, compression="zstd")
+
+
+def pa_read(fs: AbstractFileSystem, path: str, columns: Optional[List[str]] = None) -> pa.Table:
+    """Read PyArrow table (from Arrow IPC) from a path within a filesystem.
+
+    Local files are memory-mapped, data already in memory (e.g. in shared memory via
+    `Cereal.attach_model`) is used as-is, and other files are fetched in a single request.
+    Uncompressed data is then used without copying, so selecting `columns` from memory-mapped
+    files only touches the pages of those columns.
+    """
+    local_path = get_local_path(fs, path)
+    buf = take_buffer(fs, path) if local_path is None else None
+    if local_path is not None:
+        source = pa.memory_map(local_path, "r")
+    elif buf is not None:
+        source = pa.py_buffer(buf)
+    else:
+        source = pa.py_buffer(fs.cat_file(path))
+    with pa.ipc.open_file(source) as reader:
+        table = reader.read_all()
+    return table if columns is None else table.select(columns)
+
+
+def pa_wrap(cereal: "Cereal", *, compressed: bool = False) -> Type[pa.Table]:
+    """Wrap `pa.Table` for the given `cereal` with the Arrow IPC codec."""
+    writer = pa_write_compressed if compressed else pa_write
+    return cereal.wrap_type(pa.Table, reader=pa_read, writer=writer)
@@ -0,0 +1,120 @@
+"""Generic codec for arbitrary Python objects, using pickle protocol 5 with out-of-band buffers.
+
+Usage
+-----
+```python
+from pydantic_cereal.codecs.cd_pkl import pkl_read, pkl_write
+
+MyWrappedObject = cereal.wrap_type(MyObject, reader=pkl_read, writer=pkl_write)
+```
+
+Large buffers that support out-of-band pickling (such as contiguous NumPy arrays, nested anywhere
+within the object) are written as separate raw segments of the file, without copying them.
+Use `pkl_read_mmap` as the reader to memory-map these segments when the file is on a local disk.
+
+Warning
+-------
+As with any pickle, reading can run arbitrary code - only read files from trusted sources.
+"""
+
+import mmap
+import pickle
+import struct
+from typing import TYPE_CHECKING, Any, List, Type, TypeVar
+
+from fsspec import AbstractFileSystem
+
+from .._path_utils import get_local_path, take_buffer
+
+if TYPE_CHECKING:
+    from ..main import Cereal
+
+__all__ = ["pkl_read", "pkl_read_mmap", "pkl_write", "pkl_wrap"]
+
+T = TypeVar("T")
+
+_MAGIC = b"\x93CRLPKL5"
+_ALIGNMENT = 64  # so that segments are aligned for any dtype (and SIMD)
+_MIN_OUT_OF_BAND = 2**12  # smaller buffers are kept in the pickle stream
+
+
+def _padding(pos: int) -> int:
+    """Get the number of padding bytes to the next aligned position."""
+    return -pos % _ALIGNMENT
+
+
+def pkl_write(obj: Any, fs: AbstractFileSystem, path: str) -> None:
+    """Write any (picklable) object to a path within a filesystem.
+
+    The file consists of a header with the segment sizes, the pickle stream, then the raw out-of-band
+    buffers, each aligned to 64 bytes.
+    """
+    buffers: List[memoryview] = []
+
+    def buffer_callback(buf: pickle.PickleBuffer) -> bool:
+        raw = buf.raw()
+        if raw.nbytes < _MIN_OUT_OF_BAND:
+            return True  # in-band
+        buffers.append(raw)
+        return False
+
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffer_callback)
+    header = _MAGIC + struct.pack(
+        f"<QI{len(buffers)}Q", len(data), len(buffers), *(buf.nbytes for buf in buffers)
+    )
+    with fs.open(path, mode="wb") as f:
+        for segment in [header, data, *buffers]:
+            f.write(segment)
+            f.write(b"\0" * _padding(memoryview(segment).nbytes))
+
+
+def _loads_from_buffer(buf: Any) -> Any:
+    """Unpickle an object from file data in a buffer, using out-of-band buffers without copying."""
+    view = memoryview(buf).cast("B")
+    if bytes(view[: len(_MAGIC)]) != _MAGIC:
+        raise ValueError("Not a pickle-5 file written by `pkl_write`.")
+    pos = len(_MAGIC)
+    n_data, n_buffers = struct.unpack_from("<QI", view, pos)
+    pos += struct.calcsize("<QI")
+    sizes = struct.unpack_from(f"<{n_buffers}Q", view, pos)
+    pos += 8 * n_buffers
+    pos += _padding(pos)
+    data = view[pos : pos + n_data]
+    pos += n_data + _padding(n_data)
+    buffers = []
+    for size in sizes:
+        buffers.append(view[pos : pos + size])
+        pos += size + _padding(size)
+    return pickle.loads(data, buffers=buffers)
+
+
+def pkl_read(fs: AbstractFileSystem, path: str) -> Any:
+    """Read any object (written by `pkl_write`) from a path within a filesystem.
+
+    The file is fetched in a single request and copied once into a writable buffer, which the
+    out-of-band buffers then share, so they are writable. Use `pkl_read_mmap` to avoid that copy.
+    """
+    return _loads_from_buffer(bytearray(fs.cat_file(path)))
+
+
+def pkl_read_mmap(fs: AbstractFileSystem, path: str) -> Any:
+    """Read any object (written by `pkl_write`), mapping its buffers without copying (read-only).
+
+    Files on local disk are memory-mapped, and files already in memory (e.g. in shared memory via
+    `Cereal.attach_model`) are used as-is. On other file systems, this is the same as `pkl_read`.
+    """
+    local_path = get_local_path(fs, path)
+    if local_path is not None:
+        with open(local_path, mode="rb") as f:
+            # NOTE: The mapping stays open for as long as the loaded buffers are in use
+            return _loads_from_buffer(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    buf = take_buffer(fs, path)
+    if buf is not None:
+        return _loads_from_buffer(buf.toreadonly())
+    return pkl_read(fs, path)
+
+
+def pkl_wrap(cereal: "Cereal", type_: Type[T], *, mmap: bool = False) -> Type[T]:
+    """Wrap `type_` for the given `cereal` with the pickle-5 codec."""
+    reader = pkl_read_mmap if mmap else pkl_read
+    return cereal.wrap_type(type_, reader=reader, writer=pkl_write)
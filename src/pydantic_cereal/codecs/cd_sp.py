@@ -0,0 +1,53 @@
+"""SciPy sparse matrix codec, using the `.npz` format of `scipy.sparse.save_npz`.
+
+Usage
+-----
+```python
+import scipy.sparse
+from pydantic_cereal.codecs.cd_sp import sp_read, sp_write
+
+SparseMatrix = cereal.wrap_type(scipy.sparse.csr_matrix, reader=sp_read, writer=sp_write)
+```
+
+The default writer doesn't compress data, which is much faster to write and read.
+Use `sp_write_compressed` to trade speed for smaller files.
+"""
+
+import io
+from typing import TYPE_CHECKING, Any, Type
+
+import scipy.sparse
+from fsspec import AbstractFileSystem
+
+if TYPE_CHECKING:
+    from ..main import Cereal
+
+__all__ = ["sp_read", "sp_write", "sp_write_compressed", "sp_wrap"]
+
+
+def sp_write(obj: Any, fs: AbstractFileSystem, path: str) -> None:
+    """Write SciPy sparse matrix or array (as uncompressed `.npz`) to a path within a filesystem."""
+    with fs.open(path, mode="wb") as f:
+        scipy.sparse.save_npz(f, obj, compressed=False)
+
+
+def sp_write_compressed(obj: Any, fs: AbstractFileSystem, path: str) -> None:
+    """Write SciPy sparse matrix or array (as compressed `.npz`) to a path within a filesystem."""
+    with fs.open(path, mode="wb") as f:
+        scipy.sparse.save_npz(f, obj, compressed=True)
+
+
+def sp_read(fs: AbstractFileSystem, path: str) -> Any:
+    """Read SciPy sparse matrix or array (from `.npz`) from a path within a filesystem.
+
+    The file is fetched in a single request, as `.npz` readers seek around the file a lot.
+    """
+    return scipy.sparse.load_npz(io.BytesIO(fs.cat_file(path)))
+
+
+def sp_wrap(
+    cereal: "Cereal", type_: Type[Any] = scipy.sparse.csr_matrix, *, compressed: bool = False
+) -> Any:
+    """Wrap a SciPy sparse type for the given `cereal` with the `.npz` codec."""
+    writer = sp_write_compressed if compressed else sp_write
+    return cereal.wrap_type(type_, reader=sp_read, writer=writer)
@@ -1,5 +1,7 @@
 """Pandas example."""
 
+from typing import Any, List, Optional
+
 import pandas as pd
 from fsspec import AbstractFileSystem
 
@@ -10,8 +12,28 @@ def pd_write(obj: pd.DataFrame, fs: AbstractFileSystem, path: str) -> None:
         obj.to_parquet(f)  # type: ignore
 
 
-def pd_read(fs: AbstractFileSystem, path: str) -> pd.DataFrame:
-    """Read Pandas dataframe (as Parquet) from a path within a filesystem."""
+def pd_read(
+    fs: AbstractFileSystem,
+    path: str,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Any] = None,
+) -> pd.DataFrame:
+    """Read Pandas dataframe (as Parquet) from a path within a filesystem.
+
+    The `columns` and `filters` (in PyArrow's format, such as `[("a", ">", 1)]`) are pushed down
+    into the Parquet reader, so only the needed columns and row groups are read.
+    """
     with fs.open(path, mode="rb") as f:
-        obj = pd.read_parquet(f)  # type: ignore
+        obj = pd.read_parquet(f, columns=columns, filters=filters)  # type: ignore
     return obj
+
+
+def pd_split(obj: pd.DataFrame, n_shards: int) -> List[pd.DataFrame]:
+    """Split Pandas dataframe into (at most) `n_shards` contiguous row ranges, for sharded writing."""
+    size = -(-len(obj) // n_shards)  # ceiling division
+    return [obj.iloc[i : i + size] for i in range(0, len(obj), max(size, 1))] or [obj]
+
+
+def pd_combine(shards: List[pd.DataFrame]) -> pd.DataFrame:
+    """Combine row ranges of a Pandas dataframe, for sharded reading."""
+    return pd.concat(shards)
@@ -1,8 +1,16 @@
 """Polars example."""
 
+import os
+import shutil
+import tempfile
+import weakref
+from typing import List, Optional
+
 import polars as pl
 from fsspec import AbstractFileSystem
 
+from .._path_utils import get_local_path
+
 
 def pl_write(obj: pl.DataFrame, fs: AbstractFileSystem, path: str) -> None:
     """Write Pandas dataframe (as Parquet) to a path within a filesystem."""
@@ -10,9 +18,100 @@ def pl_write(obj: pl.DataFrame, fs: AbstractFileSystem, path: str) -> None:
         obj.write_parquet(f)
 
 
-def pl_read(fs: AbstractFileSystem, path: str) -> pl.DataFrame:
-    """Read Pandas dataframe (as Parquet) from a path within a filesystem."""
+def pl_read(
+    fs: AbstractFileSystem,
+    path: str,
+    columns: Optional[List[str]] = None,
+    filters: Optional[pl.Expr] = None,
+) -> pl.DataFrame:
+    """Read Pandas dataframe (as Parquet) from a path within a filesystem.
+
+    The `columns` and `filters` (a Polars expression, such as `pl.col("a") > 1`) are pushed down
+    into the Parquet scan, so only the needed columns and row groups are decoded. On file systems
+    other than local disk, only the needed columns are fetched (via PyArrow), then filtered.
+    """
+    if (columns is None) and (filters is None):
+        with fs.open(path, mode="rb") as f:
+            # NOTE: There is some collision happening with polars when passing 'f' directly
+            obj = pl.read_parquet(f.read())
+        return obj
+
+    def _project(lf: pl.LazyFrame) -> pl.DataFrame:
+        if filters is not None:
+            lf = lf.filter(filters)
+        if columns is not None:
+            lf = lf.select(columns)
+        return lf.collect()
+
+    local_path = get_local_path(fs, path)
+    if local_path is not None:
+        return _project(pl.scan_parquet(local_path))
+    import pyarrow.parquet as pq  # Polars can only scan local paths
+
+    needed: Optional[List[str]] = None
+    if columns is not None:
+        filter_columns = [] if filters is None else filters.meta.root_names()
+        needed = list(dict.fromkeys([*columns, *filter_columns]))
     with fs.open(path, mode="rb") as f:
-        # NOTE: There is some collision happening with polars when passing 'f' directly
-        obj = pl.read_parquet(f.read())
-    return obj
+        # NOTE: PyArrow reads the footer, then only the column chunks of the needed columns
+        table = pq.read_table(f, columns=needed)
+    projected = pl.from_arrow(table)
+    assert isinstance(projected, pl.DataFrame)
+    return _project(projected.lazy())
+
+
+def pl_split(obj: pl.DataFrame, n_shards: int) -> List[pl.DataFrame]:
+    """Split Polars dataframe into (at most) `n_shards` contiguous row ranges, for sharded writing."""
+    size = -(-obj.height // n_shards)  # ceiling division
+    return [obj.slice(i, size) for i in range(0, obj.height, max(size, 1))] or [obj]
+
+
+def pl_combine(shards: List[pl.DataFrame]) -> pl.DataFrame:
+    """Combine row ranges of a Polars dataframe, for sharded reading."""
+    return pl.concat(shards)
+
+
+def pl_lazy_write(obj: pl.LazyFrame, fs: AbstractFileSystem, path: str) -> None:
+    """Write Polars lazy frame (as Parquet) to a path within a filesystem.
+
+    The query is streamed into the file, so the full frame is never materialized in memory.
+    On file systems other than local disk, it is streamed into a local temporary file first.
+    """
+    local_path = get_local_path(fs, path)
+    if local_path is not None:
+        obj.sink_parquet(local_path)
+        return
+    # NOTE: Polars can only sink into local paths, so upload a temporary file afterwards
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = os.path.join(tmp_dir, "data.parquet")
+        obj.sink_parquet(tmp_path)
+        with open(tmp_path, mode="rb") as src, fs.open(path, mode="wb") as dst:
+            shutil.copyfileobj(src, dst)
+
+
+def pl_lazy_read(fs: AbstractFileSystem, path: str) -> pl.LazyFrame:
+    """Scan Polars lazy frame (from Parquet) from a path within a filesystem.
+
+    Filters and column selections on the result are pushed down into the file scan.
+    Nothing is read until the frame is collected, so the saved model must still exist at that time.
+
+    Note
+    ----
+    Only local files are scanned in place. On other file systems, the file is first downloaded into
+    a local temporary file (without decoding it), which is deleted once the returned frame is
+    garbage-collected - so keep the frame (or the model) alive while using frames derived from it.
+    """
+    local_path = get_local_path(fs, path)
+    if local_path is not None:
+        return pl.scan_parquet(local_path)
+    # NOTE: Polars can only scan local paths, so scan a temporary copy
+    fd, tmp_path = tempfile.mkstemp(suffix=".parquet")
+    try:
+        with os.fdopen(fd, mode="wb") as dst, fs.open(path, mode="rb") as src:
+            shutil.copyfileobj(src, dst)
+        lf = pl.scan_parquet(tmp_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    weakref.finalize(lf, os.remove, tmp_path)
+    return lf
@@ -1,11 +1,32 @@
 """User-facing classes."""
 
+import base64
+import functools
+import itertools
 import json
 import uuid
 import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import AbstractContextManager
 from pathlib import Path
-from typing import Any, List, Optional, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from fsspec import AbstractFileSystem, get_fs_token_paths
 from pydantic import (
@@ -15,6 +36,7 @@ from pydantic import (
     ValidationError,
     ValidationInfo,
     ValidatorFunctionWrapHandler,
+    create_model,
 )
 from pydantic.functional_serializers import WrapSerializer
 from pydantic.functional_validators import WrapValidator
@@ -22,25 +44,55 @@ from pydantic.json_schema import WithJsonSchema
 from typing_extensions import Annotated, Self
 from upath import UPath
 
-from ._metadata import CerealInfo, ImportString, cereal_meta_schema
-from ._path_utils import append_path_parts, ensure_empty_dir
+from ._metadata import (
+    CerealInfo,
+    ImportString,
+    cereal_meta_schema,
+    find_cereal_info_locations,
+    find_cereal_infos,
+)
+from ._overlay import OverlayFileSystem
+from ._path_utils import append_path_parts, copy_between, ensure_empty_dir
+from ._policy import IOMetrics, IOOperation, IOPolicy, run_with_policy
 from ._protocols import (
+    CerealCombiner,
+    CerealOptionsReader,
     CerealReader,
+    CerealSplitter,
     CerealWriter,
+    CombinerLike,
     ReaderLike,
+    SplitterLike,
     WriterLike,
+    bind_reader_options,
+    normalize_combiner,
     normalize_reader,
+    normalize_splitter,
     normalize_writer,
 )
+from ._shared import SharedModel
+from ._spill import SpillFileSystem
+from ._tuned import TunedFileSystem
 from ._utils import get_import_string, import_object
-from .errors import CerealContextError
+from .errors import CerealContextError, CerealProtocolError, CerealRegistrationError
 from .version import __version__
 
 T = TypeVar("T")
 TModel = TypeVar("TModel", bound=BaseModel)
 
 
-__all__ = ["Cereal", "CerealReader", "CerealWriter", "cereal_meta_schema"]
+__all__ = [
+    "Cereal",
+    "CerealReader",
+    "CerealOptionsReader",
+    "CerealWriter",
+    "CerealSplitter",
+    "CerealCombiner",
+    "SharedModel",
+    "IOPolicy",
+    "IOMetrics",
+    "cereal_meta_schema",
+]
 
 
 class CerealContext(AbstractContextManager):
@@ -54,6 +106,9 @@ class CerealContext(AbstractContextManager):
         cereal: "Cereal",
         target_path: Union[UPath, Path, str],
         fs: Optional[AbstractFileSystem] = None,
+        *,
+        inline_threshold: Optional[int] = None,
+        read_options: Optional[Mapping[str, Mapping[str, Any]]] = None,
     ) -> None:
         assert isinstance(cereal, Cereal)
         if fs is None:
@@ -79,6 +134,10 @@ class CerealContext(AbstractContextManager):
         self._target_path = inner_path
         self._fs: AbstractFileSystem = fs
         self._cereal = cereal
+        self._inline_threshold = inline_threshold
+        self._read_options: Dict[str, Dict[str, Any]] = {
+            k: dict(v) for (k, v) in (read_options or {}).items()
+        }
 
     @property
     def target_path(self) -> str:
@@ -95,6 +154,16 @@ class CerealContext(AbstractContextManager):
         """Parent of the context."""
         return self._cereal
 
+    @property
+    def inline_threshold(self) -> Optional[int]:
+        """Maximum size (in bytes) of objects to write inline, if any."""
+        return self._inline_threshold
+
+    @property
+    def read_options(self) -> Dict[str, Dict[str, Any]]:
+        """Options for readers, per object path (as in `CerealInfo.object_path`)."""
+        return self._read_options
+
     def __enter__(self: Self) -> Self:
         """Use as a context manager."""
         self.cereal._push_context(self)
@@ -133,10 +202,56 @@ class Cereal(object):
 
     # Annotation API
 
-    def wrap_type(self, type_: Type[T], reader: ReaderLike, writer: WriterLike) -> Type[T]:
-        """Wrap a type with reader and writer metadata, for use with Pydantic."""
+    def wrap_type(
+        self,
+        type_: Type[T],
+        reader: ReaderLike,
+        writer: WriterLike,
+        *,
+        shards: Optional[int] = None,
+        splitter: Optional[SplitterLike] = None,
+        combiner: Optional[CombinerLike] = None,
+        open_options: Optional[Mapping[str, Any]] = None,
+    ) -> Type[T]:
+        """Wrap a type with reader and writer metadata, for use with Pydantic.
+
+        Parameters
+        ----------
+        type_ : type
+            The type to wrap.
+        reader : CerealReader or str
+            Reader for the type (or import string to it).
+        writer : CerealWriter or str
+            Writer for the type (or import string to it).
+        shards : int, optional
+            If set, objects are split into (at most) this many shards with the `splitter`,
+            and each shard is written in parallel to its own file under the object's path.
+            When reading, the shards are read in parallel and joined with the `combiner`.
+        splitter : CerealSplitter or str, optional
+            Splits an object into shards. Required if `shards` is set.
+        combiner : CerealCombiner or str, optional
+            Combines shards into an object. Required if `shards` is set.
+        open_options : dict, optional
+            Default options for `fs.open()` when the reader and writer open files of this type,
+            such as `block_size`, `cache_type` and `cache_options`. For instance, use
+            `{"cache_type": "readahead", "block_size": 2**24}` for sequential reads, or
+            `{"cache_type": "blockcache"}` for formats read footer-first (such as Parquet).
+            These are also available to readers and writers as `fs.open_options`; since that is only
+            set for types with open options, use `getattr(fs, "open_options", {})` in shared readers.
+        """
         (f_reader, s_reader) = self._normalize_reader(reader=reader)
         (f_writer, s_writer) = self._normalize_writer(writer=writer)
+        if shards is None:
+            f_splitter: Optional[CerealSplitter] = None
+            s_combiner: Optional[ImportString] = None
+        else:
+            if shards < 1:
+                raise CerealRegistrationError(f"Number of shards must be positive, got {shards!r}")
+            if (splitter is None) or (combiner is None):
+                raise CerealRegistrationError("Sharded types require both a splitter and a combiner.")
+            f_splitter = normalize_splitter(splitter)
+            (_, s_combiner) = self._normalize_combiner(combiner=combiner)
+        open_options = None if open_options is None else dict(open_options)
 
         def f_serializer(v: Any, nxt: SerializerFunctionWrapHandler) -> CerealInfo:
             """Serialize by writing and returning metadata."""
@@ -148,7 +263,20 @@ class Cereal(object):
                 return nxt(v)
 
             # Write object
-            obj_upath = self._write_obj(v, f_writer)
+            inline_threshold = self.active_context.inline_threshold
+            inline_data: Optional[bytes] = None
+            shard_paths: Optional[List[str]] = None
+            if f_splitter is not None:
+                assert shards is not None
+                obj_upath, shard_paths = self._write_obj_sharded(
+                    v, f_writer, f_splitter, shards, open_options=open_options
+                )
+            elif inline_threshold is not None:
+                obj_upath, inline_data = self._write_obj_inline(
+                    v, f_writer, inline_threshold, open_options=open_options
+                )
+            else:
+                obj_upath = self._write_obj(v, f_writer, open_options=open_options)
             obj_path = str(obj_upath)
 
             return CerealInfo(
@@ -156,6 +284,9 @@ class Cereal(object):
                 cereal_writer=s_writer,
                 cereal_reader=s_reader,
                 object_path=obj_path,
+                shard_paths=shard_paths,
+                cereal_combiner=s_combiner,
+                inline_data=None if inline_data is None else base64.b64encode(inline_data).decode(),
                 # maybe other metadata?
             )
 
@@ -167,19 +298,28 @@ class Cereal(object):
                 # Attempting to use pydantic-cereal outside of the context. Using default validator
                 return handler(v)
             # We are in the context, so try to load it.
+            read_options = self.active_context.read_options
 
             # Try parsing `v` as metadata. If we fail, assume that validator can handle it.
             if info.mode == "json":
                 assert isinstance(v, str), "In JSON mode the input must be a string!"
                 try:
                     cereal_meta = TypeAdapter(CerealInfo).validate_json(v)
-                    loaded = self._load_from_meta(cereal_meta=cereal_meta)
+                    loaded = self._load_from_meta(
+                        cereal_meta=cereal_meta,
+                        options=read_options.get(cereal_meta.object_path),
+                        open_options=open_options,
+                    )
                 except ValidationError:
                     loaded = v
             elif info.mode == "python":
                 try:
                     cereal_meta = TypeAdapter(CerealInfo).validate_python(v)
-                    loaded = self._load_from_meta(cereal_meta=cereal_meta)
+                    loaded = self._load_from_meta(
+                        cereal_meta=cereal_meta,
+                        options=read_options.get(cereal_meta.object_path),
+                        open_options=open_options,
+                    )
                 except ValidationError:
                     loaded = v
             else:
@@ -205,15 +345,30 @@ class Cereal(object):
         model: BaseModel,
         target_path: Union[UPath, Path, str],
         fs: Optional[AbstractFileSystem] = None,
+        *,
+        inline_threshold: Optional[int] = None,
     ) -> str:
         """Write the pydantic.BaseModel to the path.
 
+        Parameters
+        ----------
+        model : BaseModel
+            The model to write.
+        target_path : UPath or Path or str
+            Path to the (new or empty) directory to write to.
+        fs : AbstractFileSystem, optional
+            File system to use. If not set, it is inferred from the `target_path`.
+        inline_threshold : int, optional
+            If set, objects that serialize to at most this many bytes are embedded in `model.json`
+            (base64-encoded) rather than written to separate files, so reading them needs no extra I/O.
+            Sharded objects are never inlined.
+
         TODO
         ----
         - Add JSON options.
         - Write YAML metadata instead?
         """
-        with self.context(target_path=target_path, fs=fs):
+        with self.context(target_path=target_path, fs=fs, inline_threshold=inline_threshold):
             # Create saving directory
             fs = self.fs
             targ_path = ensure_empty_dir(fs, self.target_path)
@@ -240,33 +395,228 @@ class Cereal(object):
         fs: Optional[AbstractFileSystem] = None,
         *,
         supercls: Type[TModel] = BaseModel,  # type: ignore
+        prefetch: bool = False,
+        max_workers: Optional[int] = None,
+        read_options: Optional[Mapping[str, Mapping[str, Any]]] = None,
     ) -> TModel:
-        """Read a pydantic.BaseModel from the path."""
-        if not issubclass(supercls, BaseModel):
-            raise TypeError(
-                f"Can only read Pydantic models, but {supercls!r} is not derived from BaseModel."
-            )
+        """Read a pydantic.BaseModel from the path.
+
+        Parameters
+        ----------
+        target_path : UPath or Path or str
+            Path to the saved model directory.
+        fs : AbstractFileSystem, optional
+            File system to use. If not set, it is inferred from the `target_path`.
+        supercls : type
+            Expected (super)class of the loaded model.
+        prefetch : bool
+            If True, all objects referenced in `model.json` are downloaded in the background,
+            while the model is being validated. Readers then use the already-fetched bytes.
+            This holds the raw bytes of not-yet-read objects in memory.
+        max_workers : int, optional
+            Maximum number of background downloads when `prefetch` is set.
+        read_options : dict, optional
+            Options for readers, per field, such as `{"my_df": {"columns": ["a", "b"]}}`.
+            Fields of nested models are separated by dots, such as `"inner.my_df"`. Options for a
+            list or dict field apply to all of its elements, unless set for an element itself
+            (such as `"my_dfs.0"`). These are passed to the readers as keyword arguments,
+            so the readers of these fields must accept them
+            (see [`CerealOptionsReader`][pydantic_cereal.CerealOptionsReader]).
+            Options for locations that don't exist in the model raise a `ValueError`.
+        """
         with self.context(target_path=target_path, fs=fs):
             fs = self.fs
             targ_path = self.target_path
             # Load raw data
-            with fs.open(append_path_parts(fs, targ_path, "model.json"), mode="r") as f:
-                model_raw = json.load(f)
+            model_raw = self._read_manifest()
             # Get model class
-            assert isinstance(model_raw, dict)
-            model_import_str = model_raw.get("class")
-            if model_import_str is None:
-                raise ValueError("No 'class' field available - cannot figure out type.")
-            model_cls = import_object(model_import_str)
-            assert issubclass(model_cls, supercls)
-            # Parse as model
-            res = TypeAdapter(model_cls).validate_python(model_raw)
+            model_cls = self._get_model_class(model_raw, supercls=supercls)
+            read_options = self._match_read_options(read_options, model_raw)
+            if not prefetch:
+                # Parse as model
+                with self.context(target_path=targ_path, fs=fs, read_options=read_options):
+                    res = TypeAdapter(model_cls).validate_python(model_raw)
+                return res
+            # Start fetching objects, then parse as model while the fetches are running
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                overlay = {
+                    path: executor.submit(fs.cat_file, path)
+                    for path in self._object_paths(find_cereal_infos(model_raw))
+                }
+                with self.context(
+                    target_path=targ_path, fs=OverlayFileSystem(fs, overlay), read_options=read_options
+                ):
+                    res = TypeAdapter(model_cls).validate_python(model_raw)
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
             return res
 
+    def iter_field(
+        self,
+        target_path: Union[UPath, Path, str],
+        field: str,
+        fs: Optional[AbstractFileSystem] = None,
+        *,
+        supercls: Type[BaseModel] = BaseModel,
+        read_ahead: int = 0,
+        read_options: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    ) -> Iterator[Any]:
+        """Iterate over a list or dict field of a saved model, loading one element at a time.
+
+        Only the elements of the field are loaded (from the entries in `model.json`), so memory use
+        stays at roughly one element, plus the raw bytes of up to `read_ahead` elements that are
+        fetched in the background.
+
+        Parameters
+        ----------
+        target_path : UPath or Path or str
+            Path to the saved model directory.
+        field : str
+            Name of the field, such as `"chunks"`. Fields of nested models are separated by dots,
+            such as `"data.chunks"`.
+        fs : AbstractFileSystem, optional
+            File system to use. If not set, it is inferred from the `target_path`.
+        supercls : type
+            Expected (super)class of the saved model.
+        read_ahead : int
+            Number of following elements to fetch in the background, while the current one is in use.
+        read_options : dict, optional
+            Options for readers, per field (as in [`read_model()`][pydantic_cereal.Cereal.read_model]),
+            such as `{"data.chunks": {"columns": ["a"]}}` for all elements.
+
+        Yields
+        ------
+        element : Any
+            For list fields, the loaded elements. For dict fields, `(key, element)` pairs.
+        """
+        if read_ahead < 0:
+            raise ValueError(f"Read-ahead must be non-negative, got {read_ahead!r}")
+        ctx = self.context(target_path=target_path, fs=fs)
+        with ctx:
+            model_raw = self._read_manifest()
+            model_cls = self._get_model_class(model_raw, supercls=supercls)
+            key_adapter, elem_model, raw_items = self._collection_field(model_cls, model_raw, field)
+            elem_paths = [self._object_paths(find_cereal_infos(raw)) for (_, raw) in raw_items]
+        read_options = self._match_read_options(read_options, model_raw)
+        name = field.split(".")[-1]
+
+        executor = ThreadPoolExecutor(max_workers=read_ahead) if read_ahead > 0 else None
+        pending: Deque[Dict[str, Future[bytes]]] = deque()
+        try:
+            for i, (key, raw) in enumerate(raw_items):
+                # Keep fetching the next elements in the background
+                if executor is not None:
+                    for j in range(i + len(pending), min(i + 1 + read_ahead, len(raw_items))):
+                        pending.append({p: executor.submit(ctx.fs.cat_file, p) for p in elem_paths[j]})
+                overlay_fs = OverlayFileSystem(ctx.fs, pending.popleft() if pending else {})
+                # NOTE: The context is only active while loading, not while the element is in use
+                with self.context(target_path=ctx.target_path, fs=overlay_fs, read_options=read_options):
+                    elem = getattr(elem_model.model_validate({name: raw}), name)
+                if key_adapter is None:
+                    yield elem
+                else:
+                    yield key_adapter.validate_python(key), elem
+                del elem
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def copy_model(
+        self,
+        src_path: Union[UPath, Path, str],
+        dst_path: Union[UPath, Path, str],
+        src_fs: Optional[AbstractFileSystem] = None,
+        dst_fs: Optional[AbstractFileSystem] = None,
+        *,
+        max_workers: Optional[int] = None,
+    ) -> str:
+        """Copy a saved model to another location, as raw files (without loading it).
+
+        This copies `model.json`, `model.schema.json` and all object files referenced in `model.json`
+        (including the files within objects that writers created as directories), without decoding
+        anything or importing the model class.
+        Within the same file system, files are copied with `fs.copy()` (which is server-side for most
+        object stores); otherwise, they are streamed between the file systems in parallel.
+
+        Parameters
+        ----------
+        src_path, dst_path : UPath or Path or str
+            Source model directory, and (new or empty) destination directory.
+        src_fs, dst_fs : AbstractFileSystem, optional
+            File systems to use. If not set, they are inferred from the paths.
+        max_workers : int, optional
+            Maximum number of parallel copies, when copying between file systems.
+        """
+        src = self.context(target_path=src_path, fs=src_fs)
+        dst = self.context(target_path=dst_path, fs=dst_fs)
+        with src:
+            model_raw = self._read_manifest()
+            parts: List[Tuple[str, ...]] = [("model.json",), ("model.schema.json",)]
+            parts += self._expand_object_path_parts(
+                self._object_path_parts(find_cereal_infos(model_raw))
+            )
+        src_paths = [append_path_parts(src.fs, src.target_path, *p) for p in parts]
+        dst_paths = [append_path_parts(dst.fs, dst.target_path, *p) for p in parts]
+
+        ensure_empty_dir(dst.fs, dst.target_path)
+        for p in sorted({p[:-1] for p in parts if len(p) > 1}):
+            dst.fs.makedirs(append_path_parts(dst.fs, dst.target_path, *p), exist_ok=True)
+        if src.fs == dst.fs:
+            src.fs.copy(src_paths, dst_paths)
+        else:
+            copy_between(src.fs, src_paths, dst.fs, dst_paths, max_workers=max_workers)
+        return dst.target_path
+
+    def preload_model(
+        self,
+        target_path: Union[UPath, Path, str],
+        fs: Optional[AbstractFileSystem] = None,
+        *,
+        max_workers: Optional[int] = None,
+    ) -> SharedModel:
+        """Preload a saved model's files into shared memory, to be read by several processes.
+
+        This reads all files of the model once (in parallel), including the files within objects that
+        writers created as directories, and doesn't import the model class.
+        Pass the result to worker processes (it can be pickled), then use
+        [`attach_model()`][pydantic_cereal.Cereal.attach_model] in each of them.
+
+        The calling process owns the shared memory: use the result as a context manager,
+        or call its `unlink()` method, to free it once the workers are done.
+        """
+        with self.context(target_path=target_path, fs=fs):
+            model_raw = self._read_manifest()
+            paths = self._object_file_paths(find_cereal_infos(model_raw))
+            return SharedModel.create(
+                model_raw, self.fs, self.target_path, paths, max_workers=max_workers
+            )
+
+    def attach_model(
+        self,
+        shared: SharedModel,
+        *,
+        supercls: Type[TModel] = BaseModel,  # type: ignore
+    ) -> TModel:
+        """Read a pydantic.BaseModel from a model preloaded into shared memory.
+
+        Readers get the files' data from shared memory directly; zero-copy readers (such as
+        `pydantic_cereal.codecs.cd_pa.pa_read`) return objects that use the shared memory as-is.
+        The `shared` object must be kept open while such objects are in use.
+        """
+        overlay_fs = OverlayFileSystem(shared.fs, shared.attach())
+        with self.context(target_path=shared.target_path, fs=overlay_fs):
+            model_cls = self._get_model_class(shared.manifest, supercls=supercls)
+            return TypeAdapter(model_cls).validate_python(shared.manifest)
+
     # Creation
 
-    def __init__(self) -> None:
+    def __init__(self, *, io_policy: Optional[IOPolicy] = None) -> None:
         self._context_stack: List[CerealContext] = []
+        self.io_policy = IOPolicy() if io_policy is None else io_policy
+        """Policy for calling readers and writers (timeouts, retries and hedged reads)."""
+        self.io_metrics = IOMetrics()
+        """Counters of reader and writer calls, and of how the `io_policy` handled them."""
 
     def __repr__(self) -> str:
         """Representation."""
@@ -275,10 +625,21 @@ class Cereal(object):
     # Internal API
 
     def context(
-        self, target_path: Union[UPath, Path, str], fs: Optional[AbstractFileSystem]
+        self,
+        target_path: Union[UPath, Path, str],
+        fs: Optional[AbstractFileSystem],
+        *,
+        inline_threshold: Optional[int] = None,
+        read_options: Optional[Mapping[str, Mapping[str, Any]]] = None,
     ) -> CerealContext:
         """Create a writing context (usable via `with` statement)."""
-        return CerealContext(self, target_path=target_path, fs=fs)
+        return CerealContext(
+            self,
+            target_path=target_path,
+            fs=fs,
+            inline_threshold=inline_threshold,
+            read_options=read_options,
+        )
 
     @property
     def active_context(self) -> Optional[CerealContext]:
@@ -322,24 +683,280 @@ class Cereal(object):
         """
         return str(uuid.uuid4()).replace("-", "")
 
-    def _write_obj(self, obj: Any, writer: CerealWriter) -> str:
+    def _write_obj(
+        self, obj: Any, writer: CerealWriter, open_options: Optional[Mapping[str, Any]] = None
+    ) -> str:
         """Write object, returning its relative path."""
         if self.active_context is None:
             raise CerealContextError("Context not active - aborting write.")
-        filename = self._generate_filename(obj)
+        fs = self._tuned_fs(open_options)
 
-        fs = self.fs
-        write_path = append_path_parts(fs, self.target_path, filename)
-        writer(obj, self.fs, write_path)
-        return filename
+        def attempt() -> str:
+            # NOTE: Each attempt uses a new file name, so abandoned attempts can't clobber it
+            filename = self._generate_filename(obj)
+            writer(obj, fs, append_path_parts(fs, self.target_path, filename))
+            return filename
+
+        return self._run_io(attempt, "write")
+
+    def _write_obj_inline(
+        self,
+        obj: Any,
+        writer: CerealWriter,
+        threshold: int,
+        open_options: Optional[Mapping[str, Any]] = None,
+    ) -> Tuple[str, Optional[bytes]]:
+        """Write object, returning its relative path and its data if it's small enough to inline.
+
+        The object is only written to its path if it's too large to inline.
+        """
+        if self.active_context is None:
+            raise CerealContextError("Context not active - aborting write.")
+        fs = self._tuned_fs(open_options)
+
+        def attempt() -> Tuple[str, Optional[bytes]]:
+            filename = self._generate_filename(obj)
+            write_path = append_path_parts(fs, self.target_path, filename)
+            spill_fs = SpillFileSystem(fs, write_path, threshold=threshold)
+            writer(obj, spill_fs, write_path)
+            return filename, spill_fs.finish()
+
+        return self._run_io(attempt, "write")
+
+    def _write_obj_sharded(
+        self,
+        obj: Any,
+        writer: CerealWriter,
+        splitter: CerealSplitter,
+        n_shards: int,
+        open_options: Optional[Mapping[str, Any]] = None,
+    ) -> Tuple[str, List[str]]:
+        """Write object in parallel shards, returning its relative path and shard paths."""
+        if self.active_context is None:
+            raise CerealContextError("Context not active - aborting write.")
+        dirname = self._generate_filename(obj)
 
-    def _load_from_meta(self, cereal_meta: CerealInfo) -> Any:
-        """Load an object from metadata."""
+        fs = self._tuned_fs(open_options)
+        dir_path = append_path_parts(fs, self.target_path, dirname)
+        fs.makedirs(dir_path, exist_ok=True)
+        parts = list(splitter(obj, n_shards))
+
+        def write_shard(i: int, part: Any) -> str:
+            attempts = itertools.count()
+
+            def attempt() -> str:
+                # NOTE: Retries use a new shard name, so abandoned attempts can't clobber it
+                n = next(attempts)
+                shard_path = f"shard-{i:05d}" if n == 0 else f"shard-{i:05d}-{n}"
+                writer(part, fs, append_path_parts(fs, dir_path, shard_path))
+                return shard_path
+
+            return self._run_io(attempt, "write")
+
+        with ThreadPoolExecutor(max_workers=max(len(parts), 1)) as executor:
+            futures = [executor.submit(write_shard, i, part) for (i, part) in enumerate(parts)]
+            shard_paths = [fut.result() for fut in futures]
+        return dirname, shard_paths
+
+    def _load_from_meta(
+        self,
+        cereal_meta: CerealInfo,
+        options: Optional[Mapping[str, Any]] = None,
+        open_options: Optional[Mapping[str, Any]] = None,
+    ) -> Any:
+        """Load an object from metadata, passing any read options to the reader."""
         f_reader, _ = self._normalize_reader(cereal_meta.cereal_reader)
+        if options:
+            f_reader = bind_reader_options(f_reader, options)
 
-        fs = self.fs
+        fs = self._tuned_fs(open_options)
         path = append_path_parts(fs, self.target_path, cereal_meta.object_path)
-        return f_reader(fs, path)
+        if cereal_meta.inline_data is not None:
+            inline_fs = OverlayFileSystem(self.fs, {path: base64.b64decode(cereal_meta.inline_data)})
+            return f_reader(self._tuned_fs(open_options, inline_fs), path)
+        if cereal_meta.shard_paths is None:
+            return self._run_io(functools.partial(f_reader, fs, path), "read")
+
+        # Read shards in parallel, then combine them
+        if cereal_meta.cereal_combiner is None:
+            raise CerealProtocolError(f"Sharded object at {path!r} has no combiner.")
+        f_combiner, _ = self._normalize_combiner(cereal_meta.cereal_combiner)
+        with ThreadPoolExecutor(max_workers=max(len(cereal_meta.shard_paths), 1)) as executor:
+            shards = list(
+                executor.map(
+                    lambda shard_path: self._run_io(
+                        functools.partial(f_reader, fs, append_path_parts(fs, path, shard_path)),
+                        "read",
+                    ),
+                    cereal_meta.shard_paths,
+                )
+            )
+        return f_combiner(shards)
+
+    def _tuned_fs(
+        self, open_options: Optional[Mapping[str, Any]], fs: Optional[AbstractFileSystem] = None
+    ) -> AbstractFileSystem:
+        """Get the (current) filesystem, applying default options when opening files (if any)."""
+        fs = self.fs if fs is None else fs
+        if not open_options:
+            return fs
+        return TunedFileSystem(fs, open_options)
+
+    def _run_io(self, func: Callable[[], T], op: IOOperation) -> T:
+        """Call a reader or writer (without arguments), according to the I/O policy."""
+        return run_with_policy(func, self.io_policy, self.io_metrics, op)
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        """Read the raw model data from the working directory."""
+        fs = self.fs
+        with fs.open(append_path_parts(fs, self.target_path, "model.json"), mode="r") as f:
+            model_raw = json.load(f)
+        assert isinstance(model_raw, dict)
+        return model_raw
+
+    @classmethod
+    def _get_model_class(cls, model_raw: Dict[str, Any], supercls: Type[TModel]) -> Type[TModel]:
+        """Import the model class, given raw model data."""
+        if not issubclass(supercls, BaseModel):
+            raise TypeError(
+                f"Can only read Pydantic models, but {supercls!r} is not derived from BaseModel."
+            )
+        model_import_str = model_raw.get("class")
+        if model_import_str is None:
+            raise ValueError("No 'class' field available - cannot figure out type.")
+        model_cls = import_object(model_import_str)
+        assert issubclass(model_cls, supercls)
+        return model_cls
+
+    @classmethod
+    def _collection_field(
+        cls, model_cls: Type[BaseModel], model_raw: Dict[str, Any], field: str
+    ) -> Tuple[Optional[TypeAdapter], Type[BaseModel], Sequence[Tuple[Any, Any]]]:
+        """Find a list or dict field in raw model data, by dotted name.
+
+        Returns the key adapter (None for lists), a model with a single field of the element type
+        (with the same name and configuration as the original field), and raw `(key, element)` pairs.
+        """
+        *parents, name = field.split(".")
+        for parent in parents:
+            if parent not in model_cls.model_fields:
+                raise ValueError(f"Model {model_cls.__qualname__!r} has no field {parent!r}.")
+            model_cls = model_cls.model_fields[parent].annotation  # type: ignore[assignment]
+            if not (isinstance(model_cls, type) and issubclass(model_cls, BaseModel)):
+                raise TypeError(f"Field {parent!r} is not a model, but {model_cls!r}.")
+            model_raw = model_raw[parent]
+        if name not in model_cls.model_fields:
+            raise ValueError(f"Model {model_cls.__qualname__!r} has no field {name!r}.")
+        annotation = model_cls.model_fields[name].annotation
+        origin, args = get_origin(annotation), get_args(annotation)
+        raw = model_raw[name]
+        if origin in (list, List) and isinstance(raw, list):
+            key_adapter, elem_type, raw_items = None, (args[0] if args else Any), list(enumerate(raw))
+        elif origin in (dict, Dict) and isinstance(raw, dict):
+            key_type, elem_type = args if args else (Any, Any)
+            key_adapter, raw_items = TypeAdapter(key_type), list(raw.items())
+        else:
+            raise TypeError(f"Field {field!r} is not a list or dict, but {annotation!r}.")
+        elem_model = create_model(  # type: ignore[call-overload]
+            f"{model_cls.__name__}Element", __config__=model_cls.model_config, **{name: (elem_type, ...)}
+        )
+        return key_adapter, elem_model, raw_items
+
+    def _object_paths(self, infos: List[CerealInfo]) -> List[str]:
+        """Get full paths of all files referenced by the metadata."""
+        fs = self.fs
+        return [
+            append_path_parts(fs, self.target_path, *parts) for parts in self._object_path_parts(infos)
+        ]
+
+    def _object_file_paths(self, infos: List[CerealInfo]) -> List[str]:
+        """Get full paths of all files of the objects, including files within directory objects."""
+        fs = self.fs
+        return [
+            append_path_parts(fs, self.target_path, *parts)
+            for parts in self._expand_object_path_parts(self._object_path_parts(infos))
+        ]
+
+    @classmethod
+    def _match_read_options(
+        cls,
+        read_options: Optional[Mapping[str, Mapping[str, Any]]],
+        model_raw: Dict[str, Any],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Match read options (per dotted field location) to objects, returning them per object path.
+
+        The options for the most specific location apply, so options for a field also apply to all
+        objects within it (such as the elements of a list field).
+        Raises a `ValueError` for locations that don't exist in the model, such as misspelled fields.
+        """
+        res: Dict[str, Dict[str, Any]] = {}
+        if not read_options:
+            return res
+        unknown = set(read_options)
+        for loc, info in find_cereal_info_locations(model_raw):
+            for n in range(len(loc), 0, -1):
+                key = ".".join(str(part) for part in loc[:n])
+                if key in read_options:
+                    res[info.object_path] = dict(read_options[key])
+                    unknown.discard(key)
+                    break
+        # Options for locations without objects (such as empty lists) are allowed, but unused
+        unknown = {key for key in unknown if not cls._has_location(model_raw, key)}
+        if unknown:
+            raise ValueError(f"Read options given for locations not in the model: {sorted(unknown)!r}")
+        return res
+
+    @staticmethod
+    def _has_location(raw: Any, key: str) -> bool:
+        """Whether a dotted location (of fields, keys and indices) exists in raw model data."""
+        for part in key.split("."):
+            if isinstance(raw, dict) and (part in raw):
+                raw = raw[part]
+            elif isinstance(raw, list) and part.isdigit() and (int(part) < len(raw)):
+                raw = raw[int(part)]
+            else:
+                return False
+        return True
+
+    @classmethod
+    def _object_path_parts(cls, infos: List[CerealInfo]) -> List[Tuple[str, ...]]:
+        """Get path parts (relative to the model directory) of all files referenced by the metadata."""
+        res: List[Tuple[str, ...]] = []
+        for info in infos:
+            if info.inline_data is not None:
+                continue  # stored in the model file itself
+            if info.shard_paths is None:
+                res.append((info.object_path,))
+            else:
+                res.extend((info.object_path, shard) for shard in info.shard_paths)
+        return res
+
+    def _expand_object_path_parts(self, parts: List[Tuple[str, ...]]) -> List[Tuple[str, ...]]:
+        """Expand path parts of objects that writers created as directories, into their files.
+
+        All files of the model are listed in a single call, rather than checking each object.
+        """
+        if not parts:
+            return []
+        fs = self.fs
+        root = fs._strip_protocol(self.target_path).rstrip(fs.sep) + fs.sep
+        files = sorted(
+            tuple(path[len(root) :].split(fs.sep))
+            for path in fs.find(self.target_path)
+            if path.startswith(root)
+        )
+        found = set(files)
+        res: List[Tuple[str, ...]] = []
+        for obj_parts in parts:
+            if obj_parts in found:
+                res.append(obj_parts)
+                continue
+            within = [f for f in files if f[: len(obj_parts)] == obj_parts]
+            if not within:
+                obj_path = append_path_parts(fs, self.target_path, *obj_parts)
+                raise FileNotFoundError(f"Object {obj_path!r} referenced by the model was not found.")
+            res.extend(within)
+        return res
 
     # Helpers
 
@@ -356,3 +973,10 @@ class Cereal(object):
         f_writer = normalize_writer(writer)
         s_writer = get_import_string(f_writer)
         return (f_writer, s_writer)
+
+    @classmethod
+    def _normalize_combiner(cls, combiner: CombinerLike) -> Tuple[CerealCombiner, ImportString]:
+        """Normalize combiner to its object and path."""
+        f_combiner = normalize_combiner(combiner)
+        s_combiner = get_import_string(f_combiner)
+        return (f_combiner, s_combiner)
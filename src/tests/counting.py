@@ -0,0 +1,103 @@
+"""File system wrapper that counts and records calls, to budget round trips to (remote) storage."""
+
+import threading
+from collections import Counter
+from typing import Any, List, Tuple
+
+from fsspec import AbstractFileSystem
+
+from pydantic_cereal._passthrough import PassthroughFileSystem
+
+COUNTED_METHODS = [
+    "cat",
+    "cat_file",
+    "copy",
+    "cp_file",
+    "exists",
+    "find",
+    "get_file",
+    "glob",
+    "info",
+    "isdir",
+    "isfile",
+    "ls",
+    "makedirs",
+    "mkdir",
+    "open",
+    "pipe",
+    "pipe_file",
+    "put_file",
+    "read_text",
+    "rm",
+    "rm_file",
+    "size",
+    "write_text",
+]
+"""Methods that (usually) make a round trip to remote storage."""
+
+BATCHED_METHODS = {"cat", "copy", "pipe"}
+"""Methods that can take several paths, making (at least) one round trip per path."""
+
+
+class CountingFileSystem(PassthroughFileSystem):
+    """File system that records calls (with their paths), and delegates them to the wrapped one.
+
+    Each call made through this file system is recorded once, even if the wrapped file system
+    implements it via other methods.
+    """
+
+    def __init__(self, fs: AbstractFileSystem):
+        super().__init__(fs)
+        self.calls: List[Tuple[str, Any]] = []
+        self._calls_lock = threading.Lock()
+        self._local = threading.local()  # calls in progress, per thread
+
+    @property
+    def counts(self) -> Counter:
+        """Number of calls, per method."""
+        with self._calls_lock:
+            return Counter(name for (name, _) in self.calls)
+
+    @property
+    def total(self) -> int:
+        """Total number of calls."""
+        with self._calls_lock:
+            return len(self.calls)
+
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        with self._calls_lock:
+            self.calls.clear()
+
+    def _record(self, name: str, path: Any) -> None:
+        """Record a call."""
+        with self._calls_lock:
+            self.calls.append((name, path))
+
+
+def _make_counted(name: str) -> Any:
+    """Create a method that records the call, then delegates it."""
+
+    def method(self: CountingFileSystem, *args: Any, **kwargs: Any) -> Any:
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            # Only record outer calls, not calls that methods make via other methods
+            path = args[0] if args else kwargs.get("path", kwargs.get("path1"))
+            if (name in BATCHED_METHODS) and isinstance(path, (list, dict)):
+                for p in path:
+                    self._record(name, p)
+            else:
+                self._record(name, path)
+        self._local.depth = depth + 1
+        try:
+            return getattr(super(CountingFileSystem, self), name)(*args, **kwargs)
+        finally:
+            self._local.depth = depth
+
+    method.__name__ = name
+    method.__doc__ = f"Record the call, then call `{name}` of the wrapped file system."
+    return method
+
+
+for _name in COUNTED_METHODS:
+    setattr(CountingFileSystem, _name, _make_counted(_name))
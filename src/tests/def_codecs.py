@@ -0,0 +1,91 @@
+"""Define types with the built-in codecs, to be used for testing."""
+
+# ruff: noqa: E402
+import pytest
+
+np = pytest.importorskip("numpy")
+pa = pytest.importorskip("pyarrow")
+scipy_sparse = pytest.importorskip("scipy.sparse")
+
+from pydantic import BaseModel, ConfigDict
+
+from pydantic_cereal.codecs.cd_np import np_wrap
+from pydantic_cereal.codecs.cd_pa import pa_wrap
+from pydantic_cereal.codecs.cd_pkl import pkl_wrap
+from pydantic_cereal.codecs.cd_sp import sp_wrap
+
+from .common import cereal
+
+
+class ArrayBag(object):
+    """Custom (non-Pydantic) object holding arrays, for the generic pickle codec."""
+
+    def __init__(self, name: str, **arrays: "np.ndarray"):
+        """Initialize the object."""
+        self.name = name
+        self.arrays = arrays
+
+    def __eq__(self, rhs: object) -> bool:
+        """Check if objects are equal."""
+        if not isinstance(rhs, ArrayBag):
+            return NotImplemented
+        return (
+            (self.name == rhs.name)
+            and (self.arrays.keys() == rhs.arrays.keys())
+            and all(np.array_equal(v, rhs.arrays[k]) for (k, v) in self.arrays.items())
+        )
+
+
+NumpyArray = np_wrap(cereal)
+NumpyArrayMmap = np_wrap(cereal, mmap=True)
+ArrowTable = pa_wrap(cereal)
+ArrowTableCompressed = pa_wrap(cereal, compressed=True)
+SparseMatrix = sp_wrap(cereal)
+PickledBag = pkl_wrap(cereal, ArrayBag)
+PickledBagMmap = pkl_wrap(cereal, ArrayBag, mmap=True)
+
+
+class ModelWithCodecs(BaseModel):
+    """Model with all built-in codecs."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    arr: NumpyArray
+    arr_f: NumpyArray
+    arr_mmap: NumpyArrayMmap
+    tbl: ArrowTable
+    tbl_zstd: ArrowTableCompressed
+    sparse: SparseMatrix
+    bag: PickledBag
+    bag_mmap: PickledBagMmap
+
+    def __eq__(self, rhs: object) -> bool:
+        """Check if objects are equal (since arrays don't support `==`)."""
+        if isinstance(rhs, ModelWithCodecs):
+            return (
+                np.array_equal(self.arr, rhs.arr)
+                and (self.arr.dtype == rhs.arr.dtype)
+                and np.array_equal(self.arr_f, rhs.arr_f)
+                and np.array_equal(self.arr_mmap, rhs.arr_mmap)
+                and self.tbl.equals(rhs.tbl)
+                and self.tbl_zstd.equals(rhs.tbl_zstd)
+                and (self.sparse != rhs.sparse).nnz == 0
+                and (self.bag == rhs.bag)
+                and (self.bag_mmap == rhs.bag_mmap)
+            )
+        return NotImplemented
+
+
+def make_codecs_model() -> ModelWithCodecs:
+    """Create a model instance with some data."""
+    tbl = pa.table({"foo": [1, 2, 3], "bar": ["a", "b", "c"]})
+    bag = ArrayBag("bag", small=np.arange(3), large=np.linspace(0, 1, 10_000).reshape(100, 100))
+    return ModelWithCodecs(
+        arr=np.arange(12, dtype="int32").reshape(3, 4),
+        arr_f=np.asfortranarray(np.linspace(0, 1, 12).reshape(4, 3)),
+        arr_mmap=np.arange(5.0),
+        tbl=tbl,
+        tbl_zstd=tbl,
+        sparse=scipy_sparse.random(20, 10, density=0.2, format="csr", random_state=42),
+        bag=bag,
+        bag_mmap=bag,
+    )
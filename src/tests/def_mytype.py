@@ -2,6 +2,8 @@
 
 # Custom object type
 
+from typing import Dict, List
+
 from fsspec import AbstractFileSystem
 from pydantic import BaseModel, ConfigDict
 from typing_extensions import TypeAlias
@@ -45,3 +47,34 @@ class MyModel(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)  # Pydantic configuration
     fld: MyWrappedType
+
+
+class MyCollectionsModel(BaseModel):
+    """Pydantic model with collections of custom objects."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    chunks: List[MyWrappedType]
+    mapping: Dict[str, MyWrappedType]
+    inner: MyModel
+
+
+def dir_writer(obj: MyType, fs: AbstractFileSystem, path: str) -> None:
+    """Write a MyType as a directory, with the value split over (nested) files."""
+    fs.makedirs(f"{path}/nested", exist_ok=True)
+    fs.pipe(f"{path}/head", obj.value[:1].encode())
+    fs.pipe(f"{path}/nested/tail", obj.value[1:].encode())
+
+
+def dir_reader(fs: AbstractFileSystem, path: str) -> MyType:
+    """Read a MyType from a directory."""
+    return MyType((fs.cat(f"{path}/head") + fs.cat(f"{path}/nested/tail")).decode())
+
+
+DirType: TypeAlias = cereal.wrap_type(MyType, reader=dir_reader, writer=dir_writer)  # type: ignore
+
+
+class DirModel(BaseModel):
+    """Model with an object that is written as a directory."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    fld: DirType
@@ -1,4 +1,5 @@
 """Define types with pandas."""
+
 """Test Pandas models."""
 
 # ruff: noqa: E402
@@ -9,11 +10,15 @@ pytest.importorskip("pandas")
 import pandas as pd
 from pydantic import BaseModel, ConfigDict
 
-from pydantic_cereal.examples.ex_pd import pd_read, pd_write
+from pydantic_cereal.examples.ex_pd import pd_combine, pd_read, pd_split, pd_write
 
 from .common import cereal
+from .def_mytype import MyWrappedType
 
 PandasDF = cereal.wrap_type(pd.DataFrame, reader=pd_read, writer=pd_write)
+ShardedPandasDF = cereal.wrap_type(
+    pd.DataFrame, reader=pd_read, writer=pd_write, shards=3, splitter=pd_split, combiner=pd_combine
+)
 
 
 class ModelWithPandas(BaseModel):
@@ -27,3 +32,30 @@ class ModelWithPandas(BaseModel):
         if isinstance(rhs, ModelWithPandas):
             return self.pdf.equals(rhs.pdf)
         return NotImplemented
+
+
+class ModelWithShardedPandas(BaseModel):
+    """Model with a sharded Pandas dataframe."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    pdf: ShardedPandasDF
+
+    def __eq__(self, rhs: object) -> bool:
+        """Check if objects are equal (since Pandas dataframes don't support `==`)."""
+        if isinstance(rhs, ModelWithShardedPandas):
+            return self.pdf.equals(rhs.pdf)
+        return NotImplemented
+
+
+class ModelWithShardedAndInline(BaseModel):
+    """Model with a sharded Pandas dataframe, and a small object that can be inlined."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    pdf: ShardedPandasDF
+    fld: MyWrappedType
+
+    def __eq__(self, rhs: object) -> bool:
+        """Check if objects are equal (since Pandas dataframes don't support `==`)."""
+        if isinstance(rhs, ModelWithShardedAndInline):
+            return self.pdf.equals(rhs.pdf) and (self.fld == rhs.fld)
+        return NotImplemented
@@ -4,11 +4,22 @@
 import polars as pl
 from pydantic import BaseModel, ConfigDict
 
-from pydantic_cereal.examples.ex_pl import pl_read, pl_write
+from pydantic_cereal.examples.ex_pl import (
+    pl_combine,
+    pl_lazy_read,
+    pl_lazy_write,
+    pl_read,
+    pl_split,
+    pl_write,
+)
 
 from .common import cereal
 
 PolarsDF = cereal.wrap_type(pl.DataFrame, pl_read, pl_write)
+PolarsLazyDF = cereal.wrap_type(pl.LazyFrame, pl_lazy_read, pl_lazy_write)
+ShardedPolarsDF = cereal.wrap_type(
+    pl.DataFrame, pl_read, pl_write, shards=3, splitter=pl_split, combiner=pl_combine
+)
 
 
 class ModelWithPolars(BaseModel):
@@ -22,3 +33,29 @@ class ModelWithPolars(BaseModel):
         if isinstance(rhs, ModelWithPolars):
             return self.pldf.equals(rhs.pldf)
         return NotImplemented
+
+
+class ModelWithShardedPolars(BaseModel):
+    """Model with a sharded Polars dataframe."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    pldf: ShardedPolarsDF
+
+    def __eq__(self, rhs: object) -> bool:
+        """Check if objects are equal (since Polars dataframes don't support `==`)."""
+        if isinstance(rhs, ModelWithShardedPolars):
+            return self.pldf.equals(rhs.pldf)
+        return NotImplemented
+
+
+class ModelWithPolarsLazy(BaseModel):
+    """Model with a Polars lazy frame."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    lf: PolarsLazyDF
+
+    def __eq__(self, rhs: object) -> bool:
+        """Check if objects are equal (by collecting the lazy frames)."""
+        if isinstance(rhs, ModelWithPolarsLazy):
+            return self.lf.collect().equals(rhs.lf.collect())
+        return NotImplemented
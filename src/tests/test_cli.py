@@ -0,0 +1,102 @@
+"""Test the command-line interface."""
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pydantic_cereal._cli import main
+
+from .common import cereal
+from .def_mytype import DirModel, MyModel, MyType
+
+
+@pytest.fixture
+def model_uri(random_path: str) -> str:
+    """Write a model, returning its URI."""
+    uri = f"memory://cli/{random_path}"
+    cereal.write_model(MyModel(fld=MyType("my_field")), uri)
+    return uri
+
+
+def test_inspect(model_uri: str):
+    """Test inspecting a saved model."""
+    out = io.StringIO()
+    assert main(["inspect", model_uri, "--json"], out=out) == 0
+    report = json.loads(out.getvalue())
+    assert report["class"] == "tests.def_mytype.MyModel"
+    assert set(report["files"]) == {"model.json", "model.schema.json"}
+    [obj] = report["objects"]
+    assert obj["location"] == "fld"
+    assert obj["size"] == len("my_field")
+    assert obj["reader"] == "tests.def_mytype.my_reader"
+
+
+def test_inspect_directory_object(random_path: str):
+    """Test that objects written as directories are reported with the size of their files."""
+    uri = f"memory://cli/{random_path}"
+    cereal.write_model(DirModel(fld=MyType("foo")), uri)
+    out = io.StringIO()
+    assert main(["inspect", uri, "--json"], out=out) == 0
+    [obj] = json.loads(out.getvalue())["objects"]
+    assert obj["size"] == len("foo")
+
+
+def test_bench(model_uri: str):
+    """Test benchmarking a saved model, finding its Cereal object automatically."""
+    out = io.StringIO()
+    assert main(["bench", model_uri, "--repeat", "2"], out=out) == 0
+    report = out.getvalue()
+    for operation in ["read_model", "write_model", "read fld", "write fld"]:
+        assert operation in report
+    assert "default open options" in report
+
+
+def test_bench_sharded(random_path: str):
+    """Test that sharded objects are benchmarked (and labelled) as unsharded writes."""
+    pytest.importorskip("pandas")
+    from .def_pandas import ModelWithShardedPandas, pd
+
+    uri = f"memory://cli/{random_path}"
+    cereal.write_model(ModelWithShardedPandas(pdf=pd.DataFrame({"foo": range(10)})), uri)
+    out = io.StringIO()
+    assert main(["bench", uri, "--repeat", "1"], out=out) == 0
+    assert "write pdf (unsharded)" in out.getvalue()
+
+
+@pytest.mark.parametrize("repeat", ["0", "-1", "x"])
+def test_bench_invalid_repeat(model_uri: str, repeat: str):
+    """Test that the number of repeats must be positive."""
+    with pytest.raises(SystemExit):
+        main(["bench", model_uri, "--repeat", repeat], out=io.StringIO())
+
+
+@pytest.mark.parametrize("mode", ["cprofile", "tracemalloc"])
+def test_profile(model_uri: str, mode: str, tmp_path: Path):
+    """Test profiling a saved model, writing the report to a file."""
+    report_path = tmp_path / "report.txt"
+    args = [
+        "profile",
+        model_uri,
+        "--cereal",
+        "tests.common.cereal",
+        "--mode",
+        mode,
+        "-o",
+        str(report_path),
+    ]
+    assert main(args, out=io.StringIO()) == 0
+    expected = {"cprofile": "read_model", "tracemalloc": "Peak"}[mode]
+    assert expected in report_path.read_text()
+
+
+def test_module_entry_point():
+    """Test that `python -m pydantic_cereal` runs."""
+    res = subprocess.run(
+        [sys.executable, "-m", "pydantic_cereal", "--help"], capture_output=True, text=True
+    )
+    assert res.returncode == 0
+    assert "inspect" in res.stdout
@@ -0,0 +1,103 @@
+"""Test copying saved models between locations, without loading them."""
+
+import json
+from pathlib import Path
+
+import pytest
+from fsspec.implementations.local import LocalFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+from pydantic import BaseModel
+from pytest_cases import parametrize_with_cases
+
+from .common import cereal
+from .def_mytype import DirModel, MyType
+from .test_roundtrip import CerealObjectTestCases
+
+
+class CopyTargetTestCases:
+    """Destination URIs, relative to a memory source."""
+
+    def case_same_fs(self) -> str:
+        """Memory URI (same file system)."""
+        return "memory://copy-dst"
+
+    def case_other_fs(self, tmp_path: Path) -> str:
+        """Local path URI (different file system)."""
+        return f"file://{tmp_path.resolve()}"
+
+
+@parametrize_with_cases(["dst_uri"], cases=CopyTargetTestCases)
+@parametrize_with_cases(["obj"], cases=CerealObjectTestCases)
+def test_copy_model(dst_uri: str, obj: BaseModel, random_path: str):
+    """Test copying models within and between file systems."""
+    src = f"memory://copy-src/{random_path}"
+    dst = f"{dst_uri}/{random_path}"
+    cereal.write_model(obj, src)
+    cereal.copy_model(src, dst)
+    assert cereal.read_model(dst) == obj
+
+
+def test_copy_sharded_and_inline(random_path: str, tmp_path: Path):
+    """Test copying models with both sharded and inline objects."""
+    pytest.importorskip("pandas")
+    from .def_pandas import ModelWithShardedAndInline, pd
+
+    obj = ModelWithShardedAndInline(pdf=pd.DataFrame({"foo": range(10)}), fld=MyType("foo"))
+    src = f"memory://copy-src/{random_path}"
+    cereal.write_model(obj, src, inline_threshold=2**10)  # the sharded object is never inlined
+    assert json.loads(MemoryFileSystem().cat_file(f"{src}/model.json"))["fld"]["inline_data"]
+    cereal.copy_model(src, f"file://{tmp_path.resolve()}/{random_path}")
+    assert cereal.read_model(f"file://{tmp_path.resolve()}/{random_path}") == obj
+
+
+@parametrize_with_cases(["dst_uri"], cases=CopyTargetTestCases)
+def test_copy_directory_objects(dst_uri: str, random_path: str):
+    """Test copying models with objects that writers created as directories."""
+    obj = DirModel(fld=MyType("foo"))
+    src = f"memory://copy-src/{random_path}"
+    dst = f"{dst_uri}/{random_path}"
+    cereal.write_model(obj, src)
+    cereal.copy_model(src, dst)
+    assert cereal.read_model(dst) == obj
+
+
+def test_copy_does_not_import(random_path: str):
+    """Test that the model class isn't imported when copying."""
+    from .def_mytype import MyModel
+
+    fs = MemoryFileSystem()
+    cereal.write_model(MyModel(fld=MyType("foo")), f"/src/{random_path}", fs=fs)
+    model_raw = json.loads(fs.read_text(f"/src/{random_path}/model.json"))
+    model_raw["class"] = "no_such_package.NoSuchModel"
+    fs.write_text(f"/src/{random_path}/model.json", json.dumps(model_raw))
+
+    dst = f"/dst/{random_path}"
+    cereal.copy_model(f"/src/{random_path}", dst, src_fs=fs, dst_fs=fs)
+    assert sorted(fs.ls(dst, detail=False)) == sorted(
+        f"{dst}/{name}" for name in ["model.json", "model.schema.json", model_raw["fld"]["object_path"]]
+    )
+    with pytest.raises(ImportError):
+        cereal.read_model(dst, fs=fs)
+
+
+def test_copy_to_non_empty(random_path: str, tmp_path: Path):
+    """Test that copying refuses to overwrite existing files."""
+    from .def_mytype import MyModel
+
+    src = f"memory://copy-src/{random_path}"
+    cereal.write_model(MyModel(fld=MyType("foo")), src)
+    LocalFileSystem().touch(str(tmp_path / "existing.txt"))
+    with pytest.raises(FileExistsError):
+        cereal.copy_model(src, f"file://{tmp_path.resolve()}")
+
+
+def test_copy_missing_object(random_path: str):
+    """Test that copying fails if an object of the model is missing."""
+    from .def_mytype import MyModel
+
+    fs = MemoryFileSystem()
+    cereal.write_model(MyModel(fld=MyType("foo")), f"/src/{random_path}", fs=fs)
+    model_raw = json.loads(fs.read_text(f"/src/{random_path}/model.json"))
+    fs.rm(f"/src/{random_path}/{model_raw['fld']['object_path']}")
+    with pytest.raises(FileNotFoundError):
+        cereal.copy_model(f"/src/{random_path}", f"/dst/{random_path}", src_fs=fs, dst_fs=fs)
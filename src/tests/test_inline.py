@@ -0,0 +1,86 @@
+"""Test inlining of small objects into the model file."""
+
+import json
+
+from fsspec import AbstractFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+from pydantic import BaseModel, ConfigDict
+from pytest_cases import parametrize_with_cases
+
+from .common import cereal
+from .def_mytype import MyModel, MyType
+from .test_roundtrip import CerealObjectTestCases, FileSystemTestCases, MakeFS
+
+
+def piping_writer(obj: MyType, fs: AbstractFileSystem, path: str) -> None:
+    """Write a MyType via `fs.pipe()`."""
+    fs.pipe(path, obj.value.encode())
+
+
+def catting_reader(fs: AbstractFileSystem, path: str) -> MyType:
+    """Read a MyType via `fs.cat()`, after checking the file."""
+    assert fs.exists(path) and fs.isfile(path)
+    size = fs.size(path)
+    assert fs.info(path)["size"] == size
+    data = fs.cat(path)
+    assert len(data) == size
+    return MyType(data.decode())
+
+
+PipedType = cereal.wrap_type(MyType, reader=catting_reader, writer=piping_writer)
+
+
+class PipedModel(BaseModel):
+    """Model with a type that is written and read without opening files."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    fld: PipedType  # type: ignore
+
+
+@parametrize_with_cases(["fs_write", "fs_read"], cases=FileSystemTestCases)
+@parametrize_with_cases(["obj"], cases=CerealObjectTestCases)
+def test_roundtrip_inline(fs_write: MakeFS, fs_read: MakeFS, obj: BaseModel, random_path: str):
+    """Test round-tripping of objects that are (all) inlined."""
+    fs1 = fs_write()
+    cereal.write_model(obj, random_path, fs=fs1, inline_threshold=2**20)
+    del fs1  # HACK: This is used to close any zip files... not great
+
+    obj2 = cereal.read_model(random_path, fs=fs_read())
+    assert obj2 == obj
+
+
+def test_inline_threshold(random_path: str):
+    """Test that only objects up to the threshold are inlined, and others are written as files."""
+    fs = MemoryFileSystem()
+    small, large = f"/{random_path}/small", f"/{random_path}/large"
+    cereal.write_model(MyModel(fld=MyType("x" * 10)), small, fs=fs, inline_threshold=10)
+    cereal.write_model(MyModel(fld=MyType("x" * 11)), large, fs=fs, inline_threshold=10)
+
+    assert sorted(fs.ls(small, detail=False)) == [f"{small}/model.json", f"{small}/model.schema.json"]
+    assert json.loads(fs.read_text(f"{small}/model.json"))["fld"]["inline_data"] == "eHh4eHh4eHh4eA=="
+    assert len(fs.ls(large, detail=False)) == 3
+    assert json.loads(fs.read_text(f"{large}/model.json"))["fld"]["inline_data"] is None
+
+    assert cereal.read_model(small, fs=fs) == MyModel(fld=MyType("x" * 10))
+    assert cereal.read_model(large, fs=fs) == MyModel(fld=MyType("x" * 11))
+
+
+@parametrize_with_cases(["obj"], cases=CerealObjectTestCases)
+def test_roundtrip_spill(obj: BaseModel, random_path: str):
+    """Test round-tripping of objects that exceed the threshold while being written."""
+    uri = f"memory://spill/{random_path}"
+    cereal.write_model(obj, uri, inline_threshold=16)
+    assert cereal.read_model(uri) == obj
+
+
+def test_roundtrip_inline_pipe_cat(random_path: str):
+    """Test round-tripping of inlined objects that are written via `pipe` and read via `cat`."""
+    fs = MemoryFileSystem()
+    mdl = PipedModel(fld=MyType("foo"))
+    for inline_threshold in [None, 2**10]:
+        path = f"/{random_path}/{inline_threshold}"
+        cereal.write_model(mdl, path, fs=fs, inline_threshold=inline_threshold)
+        n_files = 2 if inline_threshold else 3
+        assert len(fs.ls(path, detail=False)) == n_files
+        assert cereal.read_model(path, fs=fs) == mdl
+        assert cereal.read_model(path, fs=fs, prefetch=True) == mdl
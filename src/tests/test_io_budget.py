@@ -0,0 +1,97 @@
+"""Test the number of file system calls ("round trips") per save and load.
+
+On object stores, each call is (at least) one request, so these budgets catch changes that add
+remote calls. If a change needs more calls on purpose, update the budgets here.
+"""
+
+import json
+from typing import Tuple
+
+from fsspec.implementations.memory import MemoryFileSystem
+from pydantic import BaseModel
+from pytest_cases import parametrize_with_cases
+
+from pydantic_cereal import Cereal
+from pydantic_cereal._metadata import find_cereal_infos
+
+from .common import cereal
+from .counting import CountingFileSystem
+from .def_mytype import MyModel, MyType
+from .test_roundtrip import CerealObjectTestCases
+from .test_sharding import ShardedObjectTestCases
+
+# Budgets for calls per model, besides the object files (and copies count one call per file)
+WRITE_BUDGET = 4  # 'ensure_empty_dir' (exists + makedirs/ls), 'model.json' and 'model.schema.json'
+READ_BUDGET = 1  # 'model.json'
+COPY_BUDGET = 6  # 'ensure_empty_dir', 'model.json', listing files, copying the 2 model files
+
+
+def count_object_files(fs: MemoryFileSystem, path: str) -> Tuple[int, int]:
+    """Count the object files and the directories of sharded objects of a saved model."""
+    infos = find_cereal_infos(json.loads(fs.cat_file(f"{path}/model.json")))
+    n_files = len(Cereal._object_path_parts(infos))
+    n_dirs = sum(info.shard_paths is not None for info in infos)
+    return n_files, n_dirs
+
+
+@parametrize_with_cases(["obj"], cases=[CerealObjectTestCases, ShardedObjectTestCases])
+def test_io_budget(obj: BaseModel, random_path: str):
+    """Test the number of calls for writing, reading (with and without prefetching) and copying."""
+    mem_fs = MemoryFileSystem()
+    fs = CountingFileSystem(mem_fs)
+    path = f"/budget/{random_path}"
+
+    cereal.write_model(obj, path, fs=fs)
+    n_files, n_dirs = count_object_files(mem_fs, path)
+    assert fs.total <= WRITE_BUDGET + n_files + n_dirs, fs.calls
+
+    fs.reset()
+    cereal.read_model(path, fs=fs)
+    assert fs.total <= READ_BUDGET + n_files, fs.calls
+
+    fs.reset()
+    cereal.read_model(path, fs=fs, prefetch=True)
+    assert fs.total <= READ_BUDGET + n_files, fs.calls
+
+    fs.reset()
+    cereal.copy_model(path, f"{path}-copy", src_fs=fs, dst_fs=fs)
+    assert fs.total <= COPY_BUDGET + n_files + n_dirs, fs.calls
+
+
+def test_io_budget_inline(random_path: str):
+    """Test that reading a model with only inline objects takes a single call."""
+    fs = CountingFileSystem(MemoryFileSystem())
+    path = f"/budget/{random_path}"
+    cereal.write_model(MyModel(fld=MyType("small")), path, fs=fs, inline_threshold=2**10)
+    assert fs.total <= WRITE_BUDGET, fs.calls
+
+    fs.reset()
+    cereal.read_model(path, fs=fs)
+    assert fs.calls == [("open", f"{path}/model.json")]
+
+
+def test_ensure_empty_dir_calls(random_path: str):
+    """Test that writing into an existing, empty directory checks it with two calls."""
+    fs = CountingFileSystem(MemoryFileSystem())
+    path = f"/budget/{random_path}"
+    fs.makedirs(path)
+
+    fs.reset()
+    cereal.write_model(MyModel(fld=MyType("foo")), path, fs=fs)
+    assert [name for (name, _) in fs.calls[:2]] == ["exists", "ls"]
+    assert fs.total <= WRITE_BUDGET + 1
+
+
+def test_batched_calls_counted_per_path(random_path: str):
+    """Test that calls with several paths are recorded once per path."""
+    fs = CountingFileSystem(MemoryFileSystem())
+    src = [f"/budget/{random_path}/a", f"/budget/{random_path}/b"]
+    dst = [f"/budget/{random_path}/c", f"/budget/{random_path}/d"]
+    fs.pipe(dict(zip(src, [b"a", b"b"])))
+    fs.copy(src, dst)
+    assert fs.cat(dst) == {dst[0]: b"a", dst[1]: b"b"}
+    assert fs.calls == [
+        *(("pipe", p) for p in src),
+        *(("copy", p) for p in src),
+        *(("cat", p) for p in dst),
+    ]
@@ -0,0 +1,193 @@
+"""Test the I/O policy (timeouts, retries and hedged reads) for readers and writers."""
+
+import json
+import threading
+import time
+from typing import Any, List
+
+import pytest
+from fsspec.implementations.dirfs import DirFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+from pydantic import BaseModel, ConfigDict
+
+from pydantic_cereal import Cereal, IOPolicy
+
+from .def_mytype import MyType, my_reader, my_writer
+
+policy_cereal = Cereal(io_policy=IOPolicy(timeout=1.0, retries=2, backoff=0.0, hedge_after=0.2))
+PolicyType = policy_cereal.wrap_type(MyType, reader=my_reader, writer=my_writer)
+
+
+def split_chars(obj: MyType, n_shards: int) -> List[MyType]:
+    """Split a MyType into (at most) `n_shards` parts of its value."""
+    size = -(-len(obj.value) // n_shards)  # ceiling division
+    return [MyType(obj.value[i : i + size]) for i in range(0, len(obj.value), size)]
+
+
+def join_chars(shards: List[MyType]) -> MyType:
+    """Join parts of a MyType."""
+    return MyType("".join(shard.value for shard in shards))
+
+
+ShardedPolicyType = policy_cereal.wrap_type(
+    MyType, reader=my_reader, writer=my_writer, shards=2, splitter=split_chars, combiner=join_chars
+)
+
+
+class PolicyModel(BaseModel):
+    """Model with an object written by `policy_cereal`."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    fld: PolicyType  # type: ignore
+
+
+class ShardedPolicyModel(BaseModel):
+    """Model with a sharded object written by `policy_cereal`."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    fld: ShardedPolicyType  # type: ignore
+
+
+class FlakyFileSystem(DirFileSystem):
+    """File system where opening objects fails, or stalls, the first few times."""
+
+    cachable = False
+
+    def __init__(self, *args: Any, n_fail: int = 0, n_stall: int = 0, stall: float = 0, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.n_fail, self.n_stall, self.stall = n_fail, n_stall, stall
+        self.n_opens = 0
+        self._lock = threading.Lock()
+
+    def _maybe_fail(self, path: str) -> None:
+        """Fail or stall when accessing objects, if requested."""
+        if path.endswith(".json"):
+            return
+        with self._lock:
+            self.n_opens += 1
+            n = self.n_opens
+        if n <= self.n_fail:
+            raise ConnectionError(f"Transient error #{n}")
+        if n <= self.n_fail + self.n_stall:
+            time.sleep(self.stall)
+
+    def read_text(self, path: str, *args: Any, **kwargs: Any) -> Any:
+        """Read text from a file, failing or stalling if requested."""
+        self._maybe_fail(path)
+        return super().read_text(path, *args, **kwargs)
+
+    def write_text(self, path: str, *args: Any, **kwargs: Any) -> Any:
+        """Write text to a file, failing or stalling if requested."""
+        self._maybe_fail(path)
+        return super().write_text(path, *args, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Reset the metrics before each test."""
+    policy_cereal.io_metrics.reset()
+
+
+def test_retry_transient_errors(random_path: str):
+    """Test that transient errors in readers and writers are retried."""
+    mem_fs = MemoryFileSystem()
+    mdl = PolicyModel(fld=MyType("foo"))
+    fs = FlakyFileSystem(path="/", fs=mem_fs, n_fail=2)
+    policy_cereal.write_model(mdl, random_path, fs=fs)
+    fs = FlakyFileSystem(path="/", fs=mem_fs, n_fail=2)
+    assert policy_cereal.read_model(random_path, fs=fs) == mdl
+    assert policy_cereal.io_metrics.as_dict() == {
+        "read.calls": 1,
+        "read.retries": 2,
+        "write.calls": 1,
+        "write.retries": 2,
+    }
+    # Each write attempt uses a new file name, so only the successful one is referenced
+    assert len(mem_fs.ls(f"/{random_path}", detail=False)) == 3
+
+
+def test_retry_shards(random_path: str):
+    """Test that retried shard writes use a new shard name, which is saved in the metadata."""
+    mem_fs = MemoryFileSystem()
+    mdl = ShardedPolicyModel(fld=MyType("foobar"))
+    policy_cereal.write_model(mdl, random_path, fs=FlakyFileSystem(path="/", fs=mem_fs, n_fail=1))
+    assert policy_cereal.io_metrics.as_dict() == {"write.calls": 2, "write.retries": 1}
+    shard_paths = json.loads(mem_fs.cat_file(f"/{random_path}/model.json"))["fld"]["shard_paths"]
+    # Either shard may have failed first
+    assert sorted(shard_paths) in (["shard-00000", "shard-00001-1"], ["shard-00000-1", "shard-00001"])
+    assert policy_cereal.read_model(random_path, fs=mem_fs) == mdl
+
+
+def test_retries_exhausted(random_path: str):
+    """Test that errors are raised after all retries failed."""
+    fs = FlakyFileSystem(path="/", fs=MemoryFileSystem(), n_fail=3)
+    with pytest.raises(Exception, match="Transient error #3"):
+        policy_cereal.write_model(PolicyModel(fld=MyType("foo")), random_path, fs=fs)
+    assert policy_cereal.io_metrics.as_dict() == {
+        "write.calls": 1,
+        "write.retries": 2,
+        "write.failures": 1,
+    }
+
+
+def test_hedged_read(random_path: str):
+    """Test that a duplicate read is started for a stalled read, and the first result is used."""
+    mem_fs = MemoryFileSystem()
+    mdl = PolicyModel(fld=MyType("foo"))
+    policy_cereal.write_model(mdl, random_path, fs=mem_fs)
+    policy_cereal.io_metrics.reset()
+
+    fs = FlakyFileSystem(path="/", fs=mem_fs, n_stall=1, stall=0.6)
+    t0 = time.perf_counter()
+    assert policy_cereal.read_model(random_path, fs=fs) == mdl
+    assert time.perf_counter() - t0 < 0.5
+    assert policy_cereal.io_metrics.as_dict() == {
+        "read.calls": 1,
+        "read.hedges": 1,
+        "read.hedge_wins": 1,
+    }
+
+
+def test_timeout_retried(random_path: str):
+    """Test that reads that time out are retried."""
+    mem_fs = MemoryFileSystem()
+    mdl = PolicyModel(fld=MyType("foo"))
+    policy_cereal.write_model(mdl, random_path, fs=mem_fs)
+
+    # Both the first read and its hedged duplicate stall for longer than the timeout
+    fs = FlakyFileSystem(path="/", fs=mem_fs, n_stall=2, stall=1.5)
+    assert policy_cereal.read_model(random_path, fs=fs) == mdl
+    metrics = policy_cereal.io_metrics.as_dict()
+    assert metrics["read.timeouts"] == 1
+    assert metrics["read.retries"] == 1
+
+
+def test_no_retry_for_other_errors(random_path: str):
+    """Test that errors that aren't I/O errors are not retried."""
+    cereal = Cereal(io_policy=IOPolicy(retries=3, backoff=0.0))
+
+    def bad_writer(obj: MyType, fs: Any, path: str) -> None:
+        raise ValueError("Not an I/O error")
+
+    BadType = cereal.wrap_type(MyType, reader=my_reader, writer=bad_writer)
+
+    class BadModel(BaseModel):
+        model_config = ConfigDict(arbitrary_types_allowed=True)
+        fld: BadType  # type: ignore
+
+    with pytest.raises(Exception, match="Not an I/O error"):
+        cereal.write_model(BadModel(fld=MyType("foo")), f"memory://{random_path}")
+    assert cereal.io_metrics.as_dict() == {"write.calls": 1, "write.failures": 1}
+
+
+def test_no_retry_for_missing_files(random_path: str):
+    """Test that errors such as missing files are not retried, although they are I/O errors."""
+    mem_fs = MemoryFileSystem()
+    policy_cereal.write_model(PolicyModel(fld=MyType("foo")), random_path, fs=mem_fs)
+    obj_path = json.loads(mem_fs.cat_file(f"/{random_path}/model.json"))["fld"]["object_path"]
+    mem_fs.rm(f"/{random_path}/{obj_path}")
+    policy_cereal.io_metrics.reset()
+
+    with pytest.raises(FileNotFoundError):
+        policy_cereal.read_model(random_path, fs=mem_fs)
+    assert policy_cereal.io_metrics.as_dict() == {"read.calls": 1, "read.failures": 1}
@@ -0,0 +1,73 @@
+"""Test iterating over collection fields of saved models, one element at a time."""
+
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+
+from .common import cereal
+from .counting import CountingFileSystem
+from .def_mytype import MyCollectionsModel, MyModel, MyType
+
+
+def count_object_reads(fs: CountingFileSystem) -> int:
+    """Count the calls that read object files (rather than 'model.json')."""
+    return sum(
+        (name in ("cat", "cat_file", "open", "read_text")) and not str(path).endswith(".json")
+        for (name, path) in list(fs.calls)
+    )
+
+
+def make_model(n: int = 5) -> MyCollectionsModel:
+    """Create a model with `n` chunks."""
+    return MyCollectionsModel(
+        chunks=[MyType(f"chunk-{i}") for i in range(n)],
+        mapping={"a": MyType("A"), "b": MyType("B")},
+        inner=MyModel(fld=MyType("inner")),
+    )
+
+
+@pytest.mark.parametrize("read_ahead", [0, 1, 3, 10])
+def test_iter_list_field(random_path: str, read_ahead: int):
+    """Test that list elements are yielded in order, loading them lazily."""
+    mdl = make_model()
+    fs = CountingFileSystem(MemoryFileSystem())
+    cereal.write_model(mdl, f"/iter/{random_path}", fs=fs)
+
+    fs.reset()
+    it = cereal.iter_field(f"/iter/{random_path}", "chunks", fs=fs, read_ahead=read_ahead)
+    assert count_object_reads(fs) == 0  # nothing is loaded until iteration starts
+    assert next(it) == MyType("chunk-0")
+    # NOTE: Background fetches may still be running
+    assert 1 <= count_object_reads(fs) <= min(1 + read_ahead, 5)
+    assert list(it) == mdl.chunks[1:]
+    assert count_object_reads(fs) == 5
+
+
+def test_iter_dict_field(random_path: str):
+    """Test that dict items are yielded as `(key, element)` pairs."""
+    uri = f"memory://iter/{random_path}"
+    mdl = make_model()
+    cereal.write_model(mdl, uri)
+    assert dict(cereal.iter_field(uri, "mapping", read_ahead=1)) == mdl.mapping
+
+
+def test_iter_bad_fields(random_path: str):
+    """Test that missing and non-collection fields raise errors."""
+    uri = f"memory://iter/{random_path}"
+    cereal.write_model(make_model(), uri)
+    with pytest.raises(ValueError):
+        next(cereal.iter_field(uri, "nonexistent"))
+    with pytest.raises(TypeError):
+        next(cereal.iter_field(uri, "inner"))
+    with pytest.raises(TypeError):
+        next(cereal.iter_field(uri, "inner.fld"))
+
+
+def test_iter_early_stop(random_path: str):
+    """Test that stopping early doesn't leave a context active."""
+    uri = f"memory://iter/{random_path}"
+    cereal.write_model(make_model(), uri)
+    it = cereal.iter_field(uri, "chunks", read_ahead=2)
+    assert next(it) == MyType("chunk-0")
+    assert cereal.active_context is None
+    it.close()
+    assert cereal.active_context is None
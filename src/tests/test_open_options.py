@@ -0,0 +1,75 @@
+"""Test default options for opening files, per wrapped type."""
+
+from typing import Any, Dict, List
+
+from fsspec import AbstractFileSystem
+from fsspec.implementations.dirfs import DirFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+from pydantic import BaseModel, ConfigDict
+
+from .common import cereal
+from .def_mytype import MyType
+
+OPEN_OPTIONS = {"block_size": 2**16, "cache_type": "readahead"}
+
+
+def opening_reader(fs: AbstractFileSystem, path: str) -> MyType:
+    """Read a MyType via `fs.open()`, checking that the options are available."""
+    assert fs.open_options == OPEN_OPTIONS  # type: ignore[attr-defined]
+    with fs.open(path, mode="rb") as f:
+        return MyType(f.read().decode())
+
+
+def opening_writer(obj: MyType, fs: AbstractFileSystem, path: str) -> None:
+    """Write a MyType via `fs.open()`, overriding the block size."""
+    with fs.open(path, mode="wb", block_size=2**20) as f:
+        f.write(obj.value.encode())
+
+
+TunedType = cereal.wrap_type(
+    MyType, reader=opening_reader, writer=opening_writer, open_options=OPEN_OPTIONS
+)
+
+
+class TunedModel(BaseModel):
+    """Model with a type that has open options."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    fld: TunedType  # type: ignore
+
+
+class RecordingFileSystem(DirFileSystem):
+    """File system that records the options that objects were opened with."""
+
+    cachable = False
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.opened: List[Dict[str, Any]] = []
+
+    def open(self, path: str, mode: str = "rb", *args: Any, **kwargs: Any) -> Any:
+        """Open a file, recording the options."""
+        if not path.endswith(".json"):
+            self.opened.append(dict(mode=mode, **kwargs))
+        return super().open(path, mode, *args, **kwargs)
+
+
+def test_open_options(random_path: str):
+    """Test that open options are applied to readers and writers, unless overridden."""
+    mdl = TunedModel(fld=MyType("foo"))
+    fs = RecordingFileSystem(path="/", fs=MemoryFileSystem())
+    cereal.write_model(mdl, random_path, fs=fs)
+    assert fs.opened == [dict(mode="wb", block_size=2**20, cache_type="readahead")]
+
+    fs.opened.clear()
+    assert cereal.read_model(random_path, fs=fs) == mdl
+    assert fs.opened == [dict(mode="rb", **OPEN_OPTIONS)]
+
+
+def test_open_options_prefetch_inline(random_path: str):
+    """Test that open options don't interfere with prefetched and inline objects."""
+    mdl = TunedModel(fld=MyType("foo"))
+    for inline_threshold in [None, 2**10]:
+        uri = f"memory://open-options/{random_path}/{inline_threshold}"
+        cereal.write_model(mdl, uri, inline_threshold=inline_threshold)
+        assert cereal.read_model(uri, prefetch=True) == mdl
@@ -0,0 +1,61 @@
+"""Test the generic pickle-5 codec with out-of-band buffers."""
+
+# ruff: noqa: E402
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fsspec.implementations.dirfs import DirFileSystem
+from fsspec.implementations.local import LocalFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+
+from pydantic_cereal.codecs.cd_pkl import pkl_read, pkl_read_mmap, pkl_write
+
+from .def_codecs import ArrayBag
+
+
+def make_bag() -> ArrayBag:
+    """Create an object with a small (in-band) and large (out-of-band) arrays."""
+    return ArrayBag(
+        "bag",
+        small=np.arange(3),
+        large=np.arange(100_000, dtype="float64"),
+        large_f=np.asfortranarray(np.ones((300, 200), dtype="int16")),
+    )
+
+
+def test_buffers_out_of_band():
+    """Test that large buffers are stored raw and aligned, after the pickle stream."""
+    fs = MemoryFileSystem()
+    bag = make_bag()
+    pkl_write(bag, fs, "/pickle5/bag.pkl")
+    data = fs.cat_file("/pickle5/bag.pkl")
+    raw = bag.arrays["large"].tobytes()
+    offset = data.find(raw)
+    assert (offset > 0) and (offset % 64 == 0)
+    assert data.count(raw) == 1
+
+    res = pkl_read(fs, "/pickle5/bag.pkl")
+    assert res == bag
+    assert res.arrays["large"].flags.writeable
+    assert res.arrays["large_f"].flags.f_contiguous
+
+
+def test_read_mmap_local(tmp_path):
+    """Test that out-of-band buffers are memory-mapped on local disk, without copying."""
+    fs = DirFileSystem(path=str(tmp_path), fs=LocalFileSystem())
+    bag = make_bag()
+    pkl_write(bag, fs, "bag.pkl")
+
+    res = pkl_read_mmap(fs, "bag.pkl")
+    assert res == bag
+    assert not res.arrays["large"].flags.writeable
+    assert not res.arrays["large"].flags.owndata
+
+
+def test_bad_file():
+    """Test that other files are rejected."""
+    fs = MemoryFileSystem()
+    fs.pipe_file("/pickle5/bad.pkl", b"not a pickle-5 file")
+    with pytest.raises(ValueError):
+        pkl_read(fs, "/pickle5/bad.pkl")
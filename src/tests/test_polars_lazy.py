@@ -0,0 +1,41 @@
+"""Test Polars lazy frames, which are scanned rather than read."""
+
+import gc
+import tempfile
+from pathlib import Path
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from .common import cereal  # noqa: E402
+from .def_polars import ModelWithPolarsLazy  # noqa: E402
+
+
+@pytest.mark.parametrize("local", [True, False])
+def test_lazy_pushdown(tmp_path: Path, random_path: str, local: bool):
+    """Test that reading returns a scan, with filters and projections pushed into it."""
+    lf = pl.LazyFrame({"foo": range(100), "bar": range(100, 200)})
+    uri = f"file://{tmp_path.resolve()}/lazy" if local else f"memory://lazy/{random_path}"
+    cereal.write_model(ModelWithPolarsLazy(lf=lf), uri)
+
+    obj = cereal.read_model(uri, supercls=ModelWithPolarsLazy)
+    assert isinstance(obj.lf, pl.LazyFrame)
+    assert "PROJECT 1/2 COLUMNS" in obj.lf.select("bar").explain()
+    query = obj.lf.filter(pl.col("foo") >= 90).select("bar")
+    assert "SELECTION" in query.explain()
+    assert query.collect()["bar"].to_list() == list(range(190, 200))
+
+
+def test_lazy_temporary_file(random_path: str):
+    """Test that scans of non-local files use a temporary file, which is deleted with the frame."""
+    uri = f"memory://lazy/{random_path}"
+    cereal.write_model(ModelWithPolarsLazy(lf=pl.LazyFrame({"foo": [1, 2, 3]})), uri)
+    tmp_dir = Path(tempfile.gettempdir())
+    before = set(tmp_dir.glob("*.parquet"))
+    obj = cereal.read_model(uri, supercls=ModelWithPolarsLazy)
+    assert len(set(tmp_dir.glob("*.parquet")) - before) == 1
+    assert obj.lf.collect()["foo"].to_list() == [1, 2, 3]
+    del obj
+    gc.collect()
+    assert set(tmp_dir.glob("*.parquet")) - before == set()
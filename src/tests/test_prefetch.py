@@ -0,0 +1,43 @@
+"""Test background prefetching of objects when reading models."""
+
+from typing import Any
+
+from fsspec.implementations.dirfs import DirFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+from pydantic import BaseModel
+from pytest_cases import parametrize_with_cases
+
+from .common import cereal
+from .def_mytype import MyModel, MyType
+from .test_roundtrip import CerealObjectTestCases
+
+
+class NoObjectOpenFileSystem(DirFileSystem):
+    """File system that only allows opening the model files, but can fetch anything."""
+
+    cachable = False
+
+    def open(self, path: str, *args: Any, **kwargs: Any) -> Any:
+        """Open a file, unless it's a serialized object."""
+        if not path.endswith(".json"):
+            raise PermissionError(f"Object was not prefetched: {path!r}")
+        return super().open(path, *args, **kwargs)
+
+
+@parametrize_with_cases(["obj"], cases=CerealObjectTestCases)
+def test_roundtrip_prefetch(obj: BaseModel, random_path: str):
+    """Test round-tripping of objects with prefetching enabled."""
+    uri = f"memory://prefetch/{random_path}"
+    cereal.write_model(obj, uri)
+    obj2 = cereal.read_model(uri, prefetch=True, max_workers=2)
+    assert obj2 == obj
+
+
+def test_prefetch_serves_readers(random_path: str):
+    """Test that readers use prefetched bytes, rather than opening files themselves."""
+    mem_fs = MemoryFileSystem()
+    mdl = MyModel(fld=MyType("prefetched"))
+    cereal.write_model(mdl, f"/prefetch/{random_path}", fs=mem_fs)
+
+    fs = NoObjectOpenFileSystem(path="/", fs=mem_fs)
+    assert cereal.read_model(f"prefetch/{random_path}", fs=fs, prefetch=True) == mdl
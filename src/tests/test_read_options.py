@@ -0,0 +1,190 @@
+"""Test per-field read options, such as column projection for dataframes."""
+
+from typing import Any, List
+
+import pytest
+from fsspec import AbstractFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+from pydantic import BaseModel, ConfigDict
+
+from pydantic_cereal import CerealProtocolError
+from pydantic_cereal._passthrough import PassthroughFileSystem
+
+from .common import cereal
+from .def_mytype import MyModel, MyType, my_writer
+
+
+def prefixing_reader(fs: AbstractFileSystem, path: str, prefix: str = "") -> MyType:
+    """Read a MyType, prefixing its value (as a read option)."""
+    return MyType(prefix + fs.read_text(path))
+
+
+PrefixedType = cereal.wrap_type(MyType, reader=prefixing_reader, writer=my_writer)
+
+
+class InnerPrefixedModel(BaseModel):
+    """Nested model with a type that accepts read options."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    fld: PrefixedType  # type: ignore
+
+
+class PrefixedModel(BaseModel):
+    """Model with types that accept read options, in nested models and lists."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    fld: PrefixedType  # type: ignore
+    inner: InnerPrefixedModel
+    items: List[PrefixedType]  # type: ignore
+
+
+def make_prefixed_model() -> PrefixedModel:
+    """Create a model with unprefixed values."""
+    return PrefixedModel(
+        fld=MyType("a"),
+        inner=InnerPrefixedModel(fld=MyType("b")),
+        items=[MyType("c"), MyType("d")],
+    )
+
+
+def test_pandas_columns_and_filters(random_path: str):
+    """Test that Pandas columns and filters are passed to the reader."""
+    from .def_pandas import ModelWithPandas, ModelWithShardedPandas, pd
+
+    df = pd.DataFrame({"foo": range(10), "bar": list("abcdefghij"), "baz": [0.5] * 10})
+    for model_cls in [ModelWithPandas, ModelWithShardedPandas]:
+        uri = f"memory://read-options/{random_path}/{model_cls.__name__}"
+        cereal.write_model(model_cls(pdf=df), uri)
+        opts = {"pdf": {"columns": ["foo", "bar"], "filters": [("foo", ">=", 5)]}}
+        res = cereal.read_model(uri, read_options=opts).pdf
+        assert list(res.columns) == ["foo", "bar"]
+        assert res["foo"].tolist() == [5, 6, 7, 8, 9]
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_polars_columns_and_filters(random_path: str, prefetch: bool):
+    """Test that Polars columns and filters are passed to the reader."""
+    from .def_polars import ModelWithPolars, pl
+
+    uri = f"memory://read-options/{random_path}"
+    df = pl.DataFrame({"foo": range(10), "bar": list("abcdefghij")})
+    cereal.write_model(ModelWithPolars(pldf=df), uri)
+    opts = {"pldf": {"columns": ["bar"], "filters": pl.col("foo") < 3}}
+    res = cereal.read_model(uri, prefetch=prefetch, read_options=opts).pldf
+    assert res.equals(pl.DataFrame({"bar": ["a", "b", "c"]}))
+
+
+class ByteCountingFile(object):
+    """File wrapper that counts the bytes read."""
+
+    def __init__(self, f: Any, owner: "ByteCountingFileSystem"):
+        self._f = f
+        self._owner = owner
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped file."""
+        return getattr(self._f, name)
+
+    def __enter__(self) -> "ByteCountingFile":
+        """Enter the context."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close the wrapped file."""
+        self._f.close()
+
+    def read(self, *args: Any) -> bytes:
+        """Read bytes, counting them."""
+        data = self._f.read(*args)
+        self._owner.n_bytes += len(data)
+        return data
+
+
+class ByteCountingFileSystem(PassthroughFileSystem):
+    """File system that counts the bytes read from opened files."""
+
+    def __init__(self, fs: AbstractFileSystem):
+        super().__init__(fs)
+        self.n_bytes = 0
+
+    def open(self, path: str, mode: str = "rb", *args: Any, **kwargs: Any) -> Any:
+        """Open a file, counting the bytes read from it."""
+        f = super().open(path, mode, *args, **kwargs)
+        return ByteCountingFile(f, self) if mode == "rb" else f
+
+
+def test_polars_columns_fetch_less(random_path: str):
+    """Test that projecting columns of a remote Polars dataframe fetches less data."""
+    from .def_polars import ModelWithPolars, pl
+
+    uri = f"memory://read-options/{random_path}"
+    df = pl.DataFrame({f"col{i}": [float(i * j) for j in range(100_000)] for i in range(10)})
+    cereal.write_model(ModelWithPolars(pldf=df), uri)
+    fs = ByteCountingFileSystem(MemoryFileSystem())
+    path = f"/read-options/{random_path}"
+    assert cereal.read_model(path, fs=fs).pldf.equals(df)
+    n_full, fs.n_bytes = fs.n_bytes, 0
+
+    opts = {"pldf": {"columns": ["col1"], "filters": pl.col("col2") < 20}}
+    res = cereal.read_model(path, fs=fs, read_options=opts).pldf
+    assert res.equals(pl.DataFrame({"col1": [float(j) for j in range(10)]}))
+    assert fs.n_bytes < n_full / 3
+
+
+def test_unknown_fields_raise(random_path: str):
+    """Test that options for locations that aren't in the model raise an error (e.g. typos)."""
+    uri = f"memory://read-options/{random_path}"
+    mdl = MyModel(fld=MyType("foo"))
+    cereal.write_model(mdl, uri)
+    with pytest.raises(ValueError, match="'fldd', 'other'"):
+        cereal.read_model(uri, read_options={"fldd": {"columns": ["a"]}, "other": {}})
+
+    uri = f"memory://read-options/{random_path}/prefixed"
+    cereal.write_model(make_prefixed_model(), uri)
+    with pytest.raises(ValueError, match="'items.5'"):
+        next(cereal.iter_field(uri, "items", read_options={"items.5": {"prefix": "x"}}))
+
+
+def test_options_for_empty_fields(random_path: str):
+    """Test that options for fields without objects (such as empty lists) are allowed."""
+    uri = f"memory://read-options/{random_path}"
+    mdl = PrefixedModel(fld=MyType("a"), inner=InnerPrefixedModel(fld=MyType("b")), items=[])
+    cereal.write_model(mdl, uri)
+    assert cereal.read_model(uri, read_options={"items": {"prefix": "x"}}) == mdl
+
+
+def test_unsupported_options_raise(random_path: str):
+    """Test that passing options the reader doesn't accept raises an error."""
+    uri = f"memory://read-options/{random_path}"
+    cereal.write_model(MyModel(fld=MyType("foo")), uri)
+    with pytest.raises(CerealProtocolError):
+        cereal.read_model(uri, read_options={"fld": {"columns": ["a"]}})
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_options_per_dotted_location(random_path: str, prefetch: bool):
+    """Test that options are matched to fields by their dotted location."""
+    uri = f"memory://read-options/{random_path}"
+    cereal.write_model(make_prefixed_model(), uri)
+
+    def read_values(read_options: dict) -> List[str]:
+        res = cereal.read_model(uri, prefetch=prefetch, read_options=read_options)
+        return [res.fld.value, res.inner.fld.value, *(x.value for x in res.items)]
+
+    assert read_values({"fld": {"prefix": "x"}}) == ["xa", "b", "c", "d"]
+    assert read_values({"inner.fld": {"prefix": "x"}}) == ["a", "xb", "c", "d"]
+    assert read_values({"inner": {"prefix": "x"}}) == ["a", "xb", "c", "d"]
+    assert read_values({"items": {"prefix": "x"}, "items.1": {"prefix": "y"}}) == [
+        "a",
+        "b",
+        "xc",
+        "yd",
+    ]
+
+
+def test_options_iter_field(random_path: str):
+    """Test that options are matched to elements of iterated fields by their dotted location."""
+    uri = f"memory://read-options/{random_path}"
+    cereal.write_model(make_prefixed_model(), uri)
+    opts = {"fld": {"prefix": "x"}, "items": {"prefix": "y"}, "items.0": {"prefix": "z"}}
+    assert [x.value for x in cereal.iter_field(uri, "items", read_options=opts)] == ["zc", "yd"]
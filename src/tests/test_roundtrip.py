@@ -84,6 +84,20 @@ class CerealObjectTestCases:
         mdl = ModelWithPolars(pldf=df)
         return mdl
 
+    def case_polars_lazy_model(self) -> BaseModel:
+        """Case with a Polars lazy frame."""
+        from .def_polars import ModelWithPolarsLazy, pl
+
+        lf = pl.LazyFrame({"foo": [1, 2, 3]}).with_columns(bar=pl.col("foo") * 2)
+        mdl = ModelWithPolarsLazy(lf=lf)
+        return mdl
+
+    def case_codecs_model(self) -> BaseModel:
+        """Case with all built-in codecs."""
+        from .def_codecs import make_codecs_model
+
+        return make_codecs_model()
+
 
 @parametrize_with_cases(["fs_write", "fs_read"], cases=FileSystemTestCases)
 @parametrize_with_cases(["obj"], cases=CerealObjectTestCases)
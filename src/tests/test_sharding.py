@@ -0,0 +1,78 @@
+"""Test sharded writing and reading of wrapped objects."""
+
+import json
+from pathlib import Path
+
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+from pydantic import BaseModel
+from pytest_cases import parametrize_with_cases
+
+from pydantic_cereal import CerealRegistrationError
+
+from .common import cereal
+from .def_mytype import MyType, my_reader, my_writer
+
+
+class ShardedObjectTestCases:
+    """Test cases of models with sharded objects."""
+
+    def case_sharded_pandas(self) -> BaseModel:
+        """Sharded Pandas dataframe."""
+        from .def_pandas import ModelWithShardedPandas, pd
+
+        return ModelWithShardedPandas(pdf=pd.DataFrame({"foo": range(10), "bar": list("abcdefghij")}))
+
+    def case_sharded_pandas_short(self) -> BaseModel:
+        """Sharded Pandas dataframe, with less rows than shards."""
+        from .def_pandas import ModelWithShardedPandas, pd
+
+        return ModelWithShardedPandas(pdf=pd.DataFrame({"foo": [1]}))
+
+    def case_sharded_polars(self) -> BaseModel:
+        """Sharded Polars dataframe."""
+        from .def_polars import ModelWithShardedPolars, pl
+
+        return ModelWithShardedPolars(pldf=pl.DataFrame({"foo": range(10), "bar": list("abcdefghij")}))
+
+
+class ShardedUriTestCases:
+    """URIs that support parallel writes."""
+
+    def case_memory_uri(self) -> str:
+        """Memory URI."""
+        return "memory://sharded"
+
+    def case_local_uri(self, tmp_path: Path) -> str:
+        """Local path URI."""
+        return f"file://{tmp_path.resolve()}"
+
+
+@parametrize_with_cases(["uri"], cases=ShardedUriTestCases)
+@parametrize_with_cases(["obj"], cases=ShardedObjectTestCases)
+def test_roundtrip_sharded(uri: str, obj: BaseModel, random_path: str):
+    """Test round-tripping of sharded objects."""
+    cereal.write_model(obj, f"{uri}/{random_path}")
+    obj2 = cereal.read_model(f"{uri}/{random_path}")
+    assert obj2 == obj
+
+
+def test_shard_layout(random_path: str):
+    """Test that the shard layout is recorded in the metadata."""
+    from .def_pandas import ModelWithShardedPandas, pd
+
+    fs = MemoryFileSystem()
+    mdl = ModelWithShardedPandas(pdf=pd.DataFrame({"foo": range(10)}))
+    cereal.write_model(mdl, f"/{random_path}", fs=fs)
+
+    meta = json.loads(fs.read_text(f"/{random_path}/model.json"))["pdf"]
+    assert meta["shard_paths"] == ["shard-00000", "shard-00001", "shard-00002"]
+    assert meta["cereal_combiner"] == "pydantic_cereal.examples.ex_pd.pd_combine"
+    for shard in meta["shard_paths"]:
+        assert fs.isfile(f"/{random_path}/{meta['object_path']}/{shard}")
+
+
+def test_sharding_requires_splitter_and_combiner():
+    """Test that sharding can't be registered without a splitter and combiner."""
+    with pytest.raises(CerealRegistrationError):
+        cereal.wrap_type(MyType, reader=my_reader, writer=my_writer, shards=2)
@@ -0,0 +1,99 @@
+"""Test preloading models into shared memory, and reading them from other processes."""
+
+import multiprocessing
+import pickle
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, Tuple
+
+import pytest
+from fsspec.implementations.dirfs import DirFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+from pydantic import BaseModel
+from pytest_cases import parametrize_with_cases
+
+from pydantic_cereal import SharedModel, _shared
+
+from .common import cereal
+from .def_mytype import DirModel, MyType
+from .test_roundtrip import CerealObjectTestCases
+
+
+@parametrize_with_cases(["obj"], cases=CerealObjectTestCases)
+def test_roundtrip_shared(obj: BaseModel, random_path: str):
+    """Test preloading and attaching to models in the same process."""
+    uri = f"memory://shared/{random_path}"
+    cereal.write_model(obj, uri)
+    with cereal.preload_model(uri) as shared:
+        shared2 = pickle.loads(pickle.dumps(shared))  # as it would be sent to a worker
+        assert cereal.attach_model(shared2) == obj
+
+
+def test_shared_directory_objects(random_path: str):
+    """Test preloading objects that writers created as directories, file by file."""
+    uri = f"memory://shared/{random_path}"
+    mdl = DirModel(fld=MyType("foo"))
+    cereal.write_model(mdl, uri)
+    with cereal.preload_model(uri) as shared:
+        assert shared.nbytes == len("foo")
+        MemoryFileSystem().rm(
+            f"/shared/{random_path}/{shared.manifest['fld']['object_path']}", recursive=True
+        )
+        assert cereal.attach_model(pickle.loads(pickle.dumps(shared))) == mdl
+
+
+def _read_in_worker(shared: SharedModel) -> Tuple[float, bool, bool]:
+    """Attach to the shared model and summarize it (in a worker process)."""
+    mdl = cereal.attach_model(shared)
+    arr = mdl.arr_mmap  # type: ignore
+    res = (float(arr.sum()), bool(arr.flags.writeable), bool(arr.flags.owndata))
+    del mdl, arr
+    shared.close()
+    return res
+
+
+def test_shared_across_processes(random_path: str):
+    """Test that worker processes read the model from shared memory, without copying."""
+    pytest.importorskip("numpy")
+    from .def_codecs import make_codecs_model
+
+    uri = f"memory://shared/{random_path}"
+    cereal.write_model(make_codecs_model(), uri)
+    with cereal.preload_model(uri) as shared:
+        assert shared.nbytes > 0
+        # NOTE: Spawned workers have an empty memory file system, so they can't read the files
+        with multiprocessing.get_context("spawn").Pool(2) as pool:
+            results = pool.map(_read_in_worker, [shared, shared])
+    assert results == [(10.0, False, False)] * 2
+
+
+class ShortFileSystem(DirFileSystem):
+    """File system that reports files as larger than they are."""
+
+    cachable = False
+
+    def size(self, path: str) -> int:
+        """Get the (wrong) size of a file."""
+        return super().size(path) + 10
+
+
+def test_load_segment_failure(monkeypatch: pytest.MonkeyPatch, random_path: str):
+    """Test that failing to preload a file raises the actual error, and frees the segment."""
+    names: List[str] = []
+
+    class RecordingSharedMemory(SharedMemory):
+        def __init__(self, *args: Any, **kwargs: Any):
+            super().__init__(*args, **kwargs)
+            names.append(self.name)
+
+    monkeypatch.setattr(_shared, "SharedMemory", RecordingSharedMemory)
+    fs = MemoryFileSystem()
+    fs.pipe(f"/{random_path}/dir/file", b"foo")
+    with pytest.raises(FileNotFoundError):
+        _shared._load_segment(fs, f"/{random_path}/dir")
+    with pytest.raises(EOFError, match="shorter than expected"):
+        _shared._load_segment(ShortFileSystem(path="/", fs=fs), f"/{random_path}/dir/file")
+
+    assert len(names) == 2
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)